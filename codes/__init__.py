@@ -1,22 +1,8 @@
-"""Namespace package initialiser for the hybrid dataset code.
+"""Package initialiser for the hybrid dataset code.
 
-When this package is added to ``sys.path`` (for example by using
-``sys.path.insert(0, "./codes")`` as in the provided tests), this
-initializer ensures that the nested ``codes`` subdirectory (which
-contains the actual source modules) is also added to ``sys.path``. This
-allows top‑level imports such as ``import common`` or ``import collectors``
-to resolve correctly without requiring environment‑wide path
-manipulation.
+The source modules (``collectors``, ``common``, ``curators``, ``features``)
+live directly in this directory and import each other by their top-level
+names, so callers add this directory to ``sys.path`` (for example
+``sys.path.insert(0, "./codes")``) or run the CLI from within it. No path
+manipulation happens at import time.
 """
-
-import os
-import sys
-
-# Determine the absolute path to the nested source directory. The current
-# file resides at ``codes/codes/__init__.py``, so we navigate one level up
-# (the outer ``codes`` directory) and then down into the inner ``codes``
-# subdirectory.
-_outer_dir = os.path.dirname(__file__)
-_inner_src = os.path.join(_outer_dir, "codes")
-if os.path.isdir(_inner_src) and _inner_src not in sys.path:
-    sys.path.insert(0, _inner_src)
\ No newline at end of file
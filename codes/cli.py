@@ -1,62 +1,71 @@
 import argparse
 import logging
 import yaml
-from datetime import datetime, timezone
 from typing import Dict
 
-from collectors.eth2 import Eth2Collector
-from collectors.cosmos import CosmosCollector
-from collectors.polkadot import PolkadotCollector
+from common.utils import today_str
+
+# Prefer the libyaml-backed C loader when PyYAML was built against it; it
+# parses identical input several times faster than the pure-Python SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 def load_cfg(path: str) -> Dict[str, any]:
     """Load a YAML configuration file and return it as a dictionary."""
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 def get_chain_cfg(root_cfg: Dict[str, any], chain_id: str) -> Dict[str, any]:
     """Extract and merge chain‑specific configuration from the root config.
 
     The returned configuration inherits top‑level ``format`` and ``root`` keys
-    from the root config if they are present.
+    from the root config if they are present. Lookups go through a chain_id
+    index stashed on the root config itself, so repeated calls (e.g. from a
+    scheduler) avoid re-scanning the chains list while a re-loaded config
+    naturally starts with a fresh index.
 
     :param root_cfg: The root configuration dictionary parsed from YAML.
     :param chain_id: Identifier of the desired chain (e.g. ``"eth2"``).
     :returns: A dictionary representing the configuration for the requested chain.
     :raises SystemExit: If the chain_id is unknown.
     """
-    for c in root_cfg.get("chains", []):
-        if c["chain_id"] == chain_id:
-            cc = dict(c)
-            cc["format"] = root_cfg.get("format", "parquet")
-            cc["root"] = root_cfg.get("root", "data")
-            return cc
-    raise SystemExit(f"Unknown chain_id: {chain_id}")
+    index = root_cfg.get("_chain_index")
+    if index is None:
+        index = {c["chain_id"]: c for c in root_cfg.get("chains", [])}
+        root_cfg["_chain_index"] = index
+    try:
+        cc = dict(index[chain_id])
+    except KeyError:
+        raise SystemExit(f"Unknown chain_id: {chain_id}")
+    # Inherit top-level keys without clobbering per-chain overrides. When
+    # neither level sets ``format``, leave it absent so each component's own
+    # default applies (collectors and curators all use cfg.get("format", ...),
+    # and polkadot defaults to feather rather than parquet).
+    if "format" not in cc and "format" in root_cfg:
+        cc["format"] = root_cfg["format"]
+    cc.setdefault("root", root_cfg.get("root", "data"))
+    return cc
 
 def get_collector(chain_id: str, cfg: Dict[str, any]):
-    """Instantiate the appropriate collector for the given chain."""
+    """Instantiate the appropriate collector for the given chain.
+
+    Collector modules pull in heavy dependencies (pydantic, pandas,
+    substrate-interface, ...), so they are imported lazily here rather than
+    at module scope; ``--help`` and argument errors never pay for them.
+    """
     if chain_id == "eth2":
+        from collectors.eth2 import Eth2Collector
         print (cfg)
         return Eth2Collector(cfg)
     if chain_id == "cosmos":
+        from collectors.cosmos import CosmosCollector
         return CosmosCollector(cfg)
     if chain_id == "polkadot":
+        from collectors.polkadot import PolkadotCollector
         return PolkadotCollector(cfg)
     raise SystemExit(f"No collector for chain_id={chain_id}")
 
-def today_str() -> str:
-    """Return the current date in ``YYYY‑MM‑DD`` format (UTC)."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-def main() -> None:
-    """Entry point for the hybrid dataset construction CLI."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-    )
-    p = argparse.ArgumentParser(description="Hybrid Dataset Construction CLI")
-    p.add_argument("--config", default="config.yaml", help="Path to config.yaml")
-    sub = p.add_subparsers(dest="cmd", required=True)
-    # Collect subcommand
+def build_collect_parser(sub) -> None:
+    """Register the ``collect`` subcommand and its arguments."""
     c = sub.add_parser("collect", help="Ingest raw data from chain APIs")
     c.add_argument("--chain", required=True, choices=["eth2", "cosmos", "polkadot"])
     c.add_argument("--date", default=today_str(), help="Ingest date (YYYY-MM-DD)")
@@ -71,16 +80,47 @@ def main() -> None:
     c.add_argument("--start-height", type=int, help="[cosmos/polkadot] start height")
     c.add_argument("--end-height", type=int, help="[cosmos/polkadot] end height")
     c.add_argument("--lookback-blocks", type=int, help="[cosmos/polkadot] last N blocks")
-    # Curate subcommand
+
+def build_curate_parser(sub) -> None:
+    """Register the ``curate`` subcommand and its arguments."""
     d = sub.add_parser("curate", help="Transform raw → curated core tables")
     d.add_argument("--chain", required=True, choices=["eth2", "cosmos", "polkadot"])
     d.add_argument("--date", default=today_str())
-    # Features subcommand
+
+def build_features_parser(sub) -> None:
+    """Register the ``features`` subcommand and its arguments."""
     e = sub.add_parser(
         "features", help="Build daily features from curated tables"
     )
     e.add_argument("--chain", required=True, choices=["eth2", "cosmos", "polkadot"])
     e.add_argument("--date", default=today_str())
+
+_SUBPARSER_BUILDERS = {
+    "collect": build_collect_parser,
+    "curate": build_curate_parser,
+    "features": build_features_parser,
+}
+
+def main() -> None:
+    """Entry point for the hybrid dataset construction CLI."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    p = argparse.ArgumentParser(description="Hybrid Dataset Construction CLI")
+    p.add_argument("--config", default="config.yaml", help="Path to config.yaml")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    # Build only the subparser the invocation actually uses; argparse
+    # constructs each one eagerly otherwise. When no known subcommand token
+    # is present (e.g. --help or a typo), fall back to building all three so
+    # usage and "invalid choice" errors still list every command.
+    import sys
+    requested = next((t for t in sys.argv[1:] if t in _SUBPARSER_BUILDERS), None)
+    if requested is not None:
+        _SUBPARSER_BUILDERS[requested](sub)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(sub)
     args = p.parse_args()
     cfg = load_cfg(args.config)
     chain_cfg = get_chain_cfg(cfg, args.chain)
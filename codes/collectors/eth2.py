@@ -18,19 +18,217 @@ from __future__ import annotations
 
 from typing import List, Optional, Dict, Any, Iterable
 from pathlib import Path
+import sys
 from tqdm import tqdm
+import asyncio
 import json as _json
 from datetime import datetime, timezone
+import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import ExitStack
+import queue
+import threading
 
-from common.http import get_json
-from common.storage import write_rows, part_path, write_provenance
+try:
+    # orjson is optional. Beacon payloads run hundreds of KB to hundreds of
+    # MB; its Rust parser decodes them several times faster than stdlib
+    # json, and it serialises the penalty meta_json blobs likewise.
+    import orjson as _orjson  # type: ignore
+except Exception:
+    _orjson = None  # type: ignore
+
+if _orjson is not None:
+    def _loads(data: bytes) -> Any:
+        return _orjson.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        return _orjson.dumps(obj).decode()
+else:
+    def _loads(data: bytes) -> Any:
+        return _json.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        return _json.dumps(obj)
+
+try:
+    # ijson is optional. The sequential validator snapshot is one huge JSON
+    # document; incremental parsing avoids holding the parsed dict and the
+    # row list in memory at once.
+    import ijson  # type: ignore
+except Exception:
+    ijson = None  # type: ignore
+
+try:
+    # msgspec is optional. Its typed decoder skips undeclared keys at the C
+    # level, so block responses drop the execution payload, deposits and
+    # blob commitments during parsing instead of materialising them.
+    import msgspec  # type: ignore
+except Exception:
+    msgspec = None  # type: ignore
+
+try:
+    # zstandard is optional. When present, finalized block bodies are cached
+    # on disk so same-day re-runs (failure recovery, adding a dataset) skip
+    # the beacon node entirely; without it the cache is simply disabled.
+    import zstandard  # type: ignore
+except Exception:
+    zstandard = None  # type: ignore
+
+try:
+    # httpx is optional. When available, slot fetches are multiplexed over a
+    # few HTTP/2 streams on one connection instead of one blocking request
+    # per thread; the collector falls back to the thread-pool path otherwise.
+    import httpx  # type: ignore
+except Exception:
+    httpx = None  # type: ignore
+
+try:
+    # h2 is a separate install from httpx (the http2 extra); without it
+    # httpx.AsyncClient(http2=True) raises at construction, so the flag is
+    # gated on its presence and the client falls back to HTTP/1.1.
+    import h2  # type: ignore  # noqa: F401
+except Exception:
+    h2 = None  # type: ignore
+
+import pyarrow as pa
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from common.storage import write_rows, part_path, write_provenance, BatchWriter
 from common.provenance import Provenance
-from common.schemas import Block, Validator, Attestation, Penalty
+from common.schemas import ARROW_SCHEMAS
+
+
+if msgspec is not None:
+    # Only the fields the row builders consume; everything else in a
+    # post-Merge block body is skipped during decoding.
+    class _AttData(msgspec.Struct):
+        index: Optional[str] = None
+        beacon_block_root: Optional[str] = None
+        source: Optional[dict] = None
+        target: Optional[dict] = None
+
+    class _Att(msgspec.Struct):
+        data: Optional[_AttData] = None
+
+    class _Body(msgspec.Struct):
+        attestations: List[_Att] = []
+        proposer_slashings: List[dict] = []
+        attester_slashings: List[dict] = []
+
+    class _Message(msgspec.Struct):
+        slot: str
+        proposer_index: Optional[str] = None
+        body: Optional[_Body] = None
+
+    class _BlockData(msgspec.Struct):
+        message: Optional[_Message] = None
+
+    class _BlockResp(msgspec.Struct):
+        data: Optional[_BlockData] = None
+
+    _BLOCK_DECODER = msgspec.json.Decoder(_BlockResp)
+
+    def _decode_block(content: bytes) -> Any:
+        return msgspec.to_builtins(_BLOCK_DECODER.decode(content))
+else:
+    def _decode_block(content: bytes) -> Any:
+        return _loads(content)
+
+# Block bodies are immutable once finalized, so responses for these paths
+# can be cached on disk indefinitely (the slot is captured to gate caching
+# on the finalized checkpoint).
+_CACHEABLE_PATH = re.compile(r"^/eth/v2/beacon/blocks/(\d+)$")
+
+_SLOTS_PER_EPOCH = 32
+
+# Per-slot endpoint path builders and the matching payload extractors. The
+# bound __mod__ turns path construction into a single C-level call per slot
+# — no per-call f-string formatting bytecode. The attestations sub-endpoint
+# returns only the attestation list, a fraction of a full post-Merge body.
+_BLOCK_PATH_FMT = "/eth/v2/beacon/blocks/%d".__mod__
+_ATTESTATIONS_PATH_FMT = "/eth/v1/beacon/blocks/%d/attestations".__mod__
+
+def _extract_message(payload: Dict[str, Any]) -> Any:
+    return payload["data"]["message"]
+
+def _extract_data(payload: Dict[str, Any]) -> Any:
+    return payload["data"]
+
+# Rows are flushed to the streaming writers in chunks of this size, so peak
+# memory is bounded by the chunk rather than the whole slot window.
+_FLUSH_ROWS = 8192
 
 logger = logging.getLogger(__name__)
 
+
+class _AttestationBuffer:
+    """Struct-of-arrays accumulator for attestation rows.
+
+    Attestations dominate row volume (~128 per slot); appending scalars to
+    per-column lists skips building a dict per row, and the Arrow batch is
+    assembled columnar-to-columnar against the attestations schema.
+    """
+
+    __slots__ = (
+        "heights", "epochs", "committee_indexes", "roots",
+        "source_epochs", "target_epochs",
+    )
+
+    def __init__(self) -> None:
+        self.heights: List[int] = []
+        self.epochs: List[int] = []
+        self.committee_indexes: List[Optional[int]] = []
+        self.roots: List[Optional[str]] = []
+        self.source_epochs: List[Optional[int]] = []
+        self.target_epochs: List[Optional[int]] = []
+
+    def __len__(self) -> int:
+        return len(self.heights)
+
+    def append(self, atts: List[Dict[str, Any]], slot_i: int) -> None:
+        """Append one column entry per attestation in ``atts`` for a slot."""
+        epoch = slot_i // 32
+        heights = self.heights
+        epochs = self.epochs
+        committee_indexes = self.committee_indexes
+        roots = self.roots
+        source_epochs = self.source_epochs
+        target_epochs = self.target_epochs
+        for att in atts:
+            ad = att.get("data") or {}
+            index = ad.get("index")
+            src = ad.get("source")
+            tgt = ad.get("target")
+            heights.append(slot_i)
+            epochs.append(epoch)
+            committee_indexes.append(int(index) if index is not None else None)
+            roots.append(ad.get("beacon_block_root"))
+            source_epochs.append(int(src["epoch"]) if src else None)
+            target_epochs.append(int(tgt["epoch"]) if tgt else None)
+
+    def to_batch(self, chain_id: str, network: str) -> pa.RecordBatch:
+        n = len(self.heights)
+        schema = ARROW_SCHEMAS["attestations"]
+        return pa.RecordBatch.from_arrays(
+            [
+                pa.array([chain_id] * n, pa.string()),
+                pa.array([network] * n, pa.string()),
+                pa.array(self.heights, pa.int64()),
+                pa.array(self.epochs, pa.int64()),
+                pa.array(self.committee_indexes, pa.int64()),
+                pa.array(self.roots, pa.string()),
+                pa.array(self.source_epochs, pa.int64()),
+                pa.array(self.target_epochs, pa.int64()),
+            ],
+            schema=schema,
+        )
+
 class Eth2Collector:
     """Collects Ethereum 2 (Beacon chain) data from a REST API.
 
@@ -42,7 +240,8 @@ class Eth2Collector:
         * ``headers``: Optional HTTP headers (e.g. API keys).
         * ``max_workers``: Optional integer controlling concurrency. Values
           greater than one will enable concurrent fetching of slots for
-          blocks, attestations and penalties. Defaults to 1 (sequential).
+          blocks, attestations and penalties. When omitted, the collector
+          probes the head-slot RTT and sizes the pool automatically.
     """
 
     def __init__(self, cfg: dict) -> None:
@@ -56,13 +255,380 @@ class Eth2Collector:
         self.root: Path = Path(cfg.get("root", "data"))
         # Optional headers for API authentication
         self.headers: Dict[str, str] = cfg.get("headers", {})
-        # Concurrency control: number of worker threads
-        self.max_workers: int = int(cfg.get("max_workers", 1))
+        # Concurrency control: number of worker threads. An unset value is
+        # auto-tuned from the measured head RTT — the old default of 1 was
+        # a silent 10x+ slowdown for anyone who never touched the config.
+        mw = cfg.get("max_workers")
+        self.max_workers: int = int(mw) if mw is not None else self._autotune_workers()
+        # Validator snapshot chunking: ids per request when fetching the
+        # validator set in concurrent batches (see _validators). The ids ride
+        # in the query string, so the default keeps URLs under common proxy
+        # header limits (~8 KB).
+        self.validator_chunk: int = int(cfg.get("validator_chunk", 1024))
+        # One pooled session for the collector's lifetime. Keep-alive
+        # amortises the TCP/TLS handshake across the whole slot range —
+        # previously every request paid it — and the adapter retries
+        # transient beacon-node errors at the transport layer.
+        # requests.Session is thread-safe for the GETs the workers issue.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers * 2,
+            # Transient beacon-node errors (including rate limiting) retry
+            # at the transport layer with exponential backoff, instead of
+            # the fetch helpers silently dropping the slot on first failure.
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+                respect_retry_after_header=True,
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Ask for gzip explicitly so compression survives header-stripping
+        # proxies, and advertise JSON so content negotiation never falls
+        # back to SSZ on nodes that support both.
+        self._session.headers.update(
+            {"Accept-Encoding": "gzip", "Accept": "application/json"}
+        )
+        self._session.headers.update(self.headers)
+        # One thread pool for the collector's lifetime, shared by the block
+        # fan-out and the validator chunk scan. Workers spawn lazily, so a
+        # sequential run (max_workers=1) never starts a thread.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="eth2"
+        )
+        # On-disk cache for immutable block bodies (see _get); created
+        # lazily. Keyed per network so chains sharing one root never serve
+        # each other's blocks.
+        self._cache_dir: Path = self.root / ".cache" / self.chain_id / self.network
+        # Finalized slot, resolved once per run to gate block caching.
+        self._finalized: Optional[int] = None
+
+    # Worker auto-tune targets roughly this many requests per second; the
+    # pool is sized so that many requests fit in one RTT, clamped to [8, 64].
+    _TARGET_RPS = 100
+
+    def _autotune_workers(self) -> int:
+        """Pick a worker count from the measured beacon head RTT.
+
+        Times three head-slot requests and sizes the pool to keep
+        ``_TARGET_RPS`` requests in flight at that latency. Falls back to 8
+        workers when the node is unreachable at construction time.
+        """
+        try:
+            t0 = time.perf_counter()
+            for _ in range(3):
+                requests.get(
+                    self.base + "/eth/v1/beacon/headers",
+                    headers=self.headers,
+                    timeout=(3.05, 10),
+                ).raise_for_status()
+            rtt = (time.perf_counter() - t0) / 3
+        except Exception as e:
+            workers = max(8, min(64, len(os.sched_getaffinity(0)) * 4))
+            logger.warning(
+                "eth2 worker auto-tune probe failed (%s); using %d workers",
+                e,
+                workers,
+            )
+            return workers
+        workers = max(8, min(64, int(self._TARGET_RPS * rtt)))
+        logger.info(
+            "eth2 auto-tuned max_workers=%d (head RTT %.0f ms)", workers, rtt * 1000
+        )
+        return workers
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections and the worker threads."""
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
+    def __enter__(self) -> "Eth2Collector":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _finalized_slot(self) -> int:
+        """Slot of the last finalized checkpoint, resolved once per run.
+
+        Returns 0 — which disables block caching — when the finality
+        endpoint is unavailable, so an unreachable node degrades to
+        uncached fetches rather than caching reorg-able blocks.
+        """
+        if self._finalized is None:
+            try:
+                data = self._get("/eth/v1/beacon/states/head/finality_checkpoints")
+                self._finalized = (
+                    int(data["data"]["finalized"]["epoch"]) * _SLOTS_PER_EPOCH
+                )
+            except Exception as e:
+                logger.warning(
+                    "eth2 finality probe failed (%s); block cache disabled", e
+                )
+                self._finalized = 0
+        return self._finalized
+
+    def _cache_path_for(self, path: str) -> Optional[Path]:
+        """Disk-cache location for ``path``, or ``None`` when not cacheable.
+
+        Only block bodies at or below the finalized checkpoint qualify: a
+        near-head block cached before a reorg would otherwise be served
+        forever.
+        """
+        if zstandard is None:
+            return None
+        m = _CACHEABLE_PATH.match(path)
+        if m is None or int(m.group(1)) > self._finalized_slot():
+            return None
+        key = hashlib.blake2b(path.encode(), digest_size=16).hexdigest()
+        return self._cache_dir / f"{key}.json.zst"
+
+    def _cache_read(self, cache_path: Path) -> Optional[bytes]:
+        if not cache_path.exists():
+            return None
+        return zstandard.ZstdDecompressor().decompress(cache_path.read_bytes())
+
+    def _cache_write(self, cache_path: Path, content: bytes) -> None:
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(zstandard.ZstdCompressor(level=3).compress(content))
+        except OSError as e:
+            logger.warning("eth2 block cache write failed: %s", e)
 
     def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        """Perform a GET request against the Beacon API and return the JSON payload."""
-        url = self.base + path
-        return get_json(url, params=params or {}, headers=self.headers)
+        """Perform a GET request against the Beacon API and return the JSON payload.
+
+        Responses for finalized block paths are transparently cached on
+        disk (zstd-compressed, keyed by path and network) so re-runs read
+        from disk instead of the network.
+        """
+        is_block = params is None and _CACHEABLE_PATH.match(path) is not None
+        decode = _decode_block if is_block else _loads
+        cache_path = self._cache_path_for(path) if params is None else None
+        if cache_path is not None:
+            cached = self._cache_read(cache_path)
+            if cached is not None:
+                return decode(cached)
+        resp = self._session.get(self.base + path, params=params, timeout=(3.05, 30))
+        resp.raise_for_status()
+        if cache_path is not None:
+            self._cache_write(cache_path, resp.content)
+        return decode(resp.content)
+
+    # Async-side mirror of the session adapter's Retry policy. httpx has no
+    # status-aware retry of its own (AsyncHTTPTransport retries connect
+    # errors only), so the same statuses and backoff are applied here.
+    _RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+    _RETRY_TOTAL = 5
+    _RETRY_BACKOFF = 0.3
+
+    async def _get_async(self, client, path: str):
+        """GET ``path`` on ``client`` with the pooled session's retry semantics.
+
+        The urllib3 ``Retry`` policy lives on the requests session, which the
+        httpx fan-out never touches — without this, one transient 503 would
+        silently drop a slot. Retryable statuses back off exponentially,
+        honouring ``Retry-After``; the last attempt raises as usual.
+        """
+        attempt = 0
+        while True:
+            r = await client.get(path)
+            if r.status_code not in self._RETRY_STATUSES or attempt >= self._RETRY_TOTAL:
+                r.raise_for_status()
+                return r
+            delay = self._RETRY_BACKOFF * (2 ** attempt)
+            retry_after = r.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    delay = max(delay, float(retry_after))
+                except ValueError:
+                    pass
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _fetch_slots_async(self, slots: List[int], path_fmt, extract):
+        """Yield ``(index, payload)`` pairs in completion order via httpx/HTTP2.
+
+        The event loop runs on a helper thread and hands each finished
+        payload over a bounded queue, so the consumer starts transforming
+        and writing while later fetches are still in flight and at most
+        the hand-off window is ever resident — not the whole slot range.
+        A pool of ``concurrency`` worker coroutines pulls slots from a
+        shared iterator, which also bounds how many request objects exist
+        at once. Finalized block bodies go through the same disk cache as
+        the threaded path. Failed or missed slots yield ``None`` payloads.
+        """
+        concurrency = max(self.max_workers, 4)
+        out_q: queue.Queue = queue.Queue(maxsize=concurrency * 2)
+        _end = object()
+        stop = threading.Event()
+
+        async def run() -> None:
+            loop = asyncio.get_running_loop()
+            it = iter(enumerate(slots))
+
+            async def fetch_one(i: int, slot: int) -> None:
+                path = path_fmt(slot)
+                decode = _decode_block if _CACHEABLE_PATH.match(path) else _loads
+                result: Optional[Any] = None
+                try:
+                    cache_path = self._cache_path_for(path)
+                    content = (
+                        self._cache_read(cache_path) if cache_path is not None else None
+                    )
+                    if content is None:
+                        r = await self._get_async(client, path)
+                        content = r.content
+                        if cache_path is not None:
+                            self._cache_write(cache_path, content)
+                    result = extract(decode(content))
+                except Exception as e:
+                    logger.exception("eth2 fetch failed for slot %s: %s", slot, e)
+                # The blocking put runs on the thread pool so a slow
+                # consumer parks this worker without stalling the loop.
+                await loop.run_in_executor(self._executor, out_q.put, (i, result))
+
+            async def worker() -> None:
+                for i, slot in it:
+                    if stop.is_set():
+                        return
+                    await fetch_one(i, slot)
+
+            async with httpx.AsyncClient(
+                base_url=self.base,
+                headers={
+                    "Accept-Encoding": "gzip",
+                    "Accept": "application/json",
+                    **self.headers,
+                },
+                http2=h2 is not None,
+                limits=httpx.Limits(
+                    max_connections=concurrency, max_keepalive_connections=concurrency
+                ),
+                timeout=30,
+            ) as client:
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        def pump() -> None:
+            try:
+                asyncio.run(run())
+            except BaseException as e:  # re-raised on the consumer side
+                out_q.put(e)
+            out_q.put(_end)
+
+        thread = threading.Thread(target=pump, name="eth2-httpx-fetch", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = out_q.get()
+                if item is _end:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # On early close, tell the workers to wind down and drain the
+            # queue so producers blocked on put() can finish.
+            stop.set()
+            while thread.is_alive():
+                try:
+                    out_q.get_nowait()
+                except queue.Empty:
+                    time.sleep(0.05)
+            thread.join()
+
+    def _iter_slot_payloads(
+        self,
+        start: int,
+        end: int,
+        desc: str,
+        path_fmt=_BLOCK_PATH_FMT,
+        extract=_extract_message,
+    ):
+        """Yield ``(slot, payload)`` pairs for ``start..end`` in slot order.
+
+        Dispatches to the httpx/HTTP2 pipeline when available, otherwise to a
+        thread pool (or a plain loop when ``max_workers`` is 1). Pairs are
+        yielded as soon as a contiguous prefix of slots has completed, so
+        consumers can transform and write while later fetches are still in
+        flight. Failed or missed slots yield ``None`` payloads.
+        """
+        slots = list(range(start, end + 1))
+
+        def fetch(slot: int) -> Optional[Any]:
+            try:
+                return extract(self._get(path_fmt(slot)))
+            except Exception as e:
+                logger.exception("eth2 fetch failed for slot %s: %s", slot, e)
+                return None
+
+        if self.max_workers > 1:
+            if httpx is not None:
+                pairs = self._fetch_slots_async(slots, path_fmt, extract)
+            else:
+                pairs = self._map_bounded(
+                    self._executor, fetch, slots, self.max_workers * 2
+                )
+            with tqdm(
+                total=len(slots),
+                desc=desc,
+                unit="slot",
+                mininterval=0.5,
+                miniters=max(1, len(slots) // 200),
+                disable=not sys.stderr.isatty(),
+            ) as pbar:
+                # Reorder buffer: results complete out of order but are
+                # released in slot order; it holds at most the
+                # submission window of payloads.
+                buffered: Dict[int, Optional[Dict[str, Any]]] = {}
+                next_i = 0
+                for i, res in pairs:
+                    buffered[i] = res
+                    pbar.update(1)
+                    while next_i in buffered:
+                        yield slots[next_i], buffered.pop(next_i)
+                        next_i += 1
+        else:
+            for s in tqdm(
+                slots,
+                desc=desc,
+                unit="slot",
+                mininterval=0.5,
+                miniters=max(1, len(slots) // 200),
+                disable=not sys.stderr.isatty(),
+            ):
+                yield s, fetch(s)
+
+    @staticmethod
+    def _map_bounded(executor, fn, items, max_in_flight):
+        """Yield ``(index, result)`` pairs with a bounded submission window.
+
+        Submitting an entire backfill range up front materialises one
+        Future per slot (100k+ objects on large windows) that as_completed
+        then keeps alive until the pool drains. This sliding window keeps
+        at most ``max_in_flight`` futures pending and drops each one as
+        soon as its result is yielded. Results arrive in completion order.
+        """
+        it = enumerate(items)
+        pending: Dict[Any, int] = {}
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_in_flight:
+                try:
+                    i, x = next(it)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[executor.submit(fn, x)] = i
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                yield pending.pop(f), f.result()
 
     def _head_slot(self) -> int:
         """Retrieve the latest known slot from the beacon node."""
@@ -103,97 +669,127 @@ class Eth2Collector:
         # Ensure there is at least one slot to process
         if end < start:
             raise ValueError(f"Invalid slot range: start={start} end={end}")
-        # Dispatch to dataset-specific collectors
-        if "blocks" in datasets:
-            self._blocks(start, end, ingest_date)
+        # All block-derived datasets come from the same endpoint, so fetch
+        # each slot exactly once and route the payload through every
+        # requested row builder instead of re-fetching per dataset.
+        wanted = [d for d in ("blocks", "attestations", "penalties") if d in datasets]
+        if wanted:
+            self._block_datasets(start, end, ingest_date, wanted)
         if "validators" in datasets:
             self._validators(ingest_date)
-        if "attestations" in datasets:
-            self._attestations(start, end, ingest_date)
-        if "penalties" in datasets:
-            self._penalties(start, end, ingest_date)
-
-    def _blocks(self, start: int, end: int, date: str) -> None:
-        """Collect block headers for a range of slots and persist them to disk."""
-        def fetch_block(slot: int) -> Optional[Dict[str, Any]]:
-            """Helper to fetch and parse a single block. Returns None on error."""
-            try:
-                b = self._get(f"/eth/v2/beacon/blocks/{slot}")["data"]["message"]
-                return Block(
-                    chain_id=self.chain_id,
-                    network=self.network,
-                    height_or_slot=int(b["slot"]),
-                    epoch=int(b["slot"]) // 32,
-                    block_hash=None,
-                    parent_hash=None,
-                    proposer_index=int(b.get("proposer_index", -1)),
-                    timestamp_utc=None,
-                ).model_dump()
-            except Exception as e:
-                logger.exception("eth2._blocks failed for slot %s: %s", slot, e)
-                return None
-
-        rows: List[Dict[str, Any]] = []
-        total = end - start + 1
-        if self.max_workers > 1:
-            # Concurrent execution
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {executor.submit(fetch_block, slot): slot for slot in range(start, end + 1)}
-                with tqdm(total=total, desc="eth2 blocks", unit="slot") as pbar:
-                    for future in as_completed(futures):
-                        res = future.result()
-                        if res is not None:
-                            rows.append(res)
-                        pbar.update(1)
-        else:
-            # Sequential execution
-            for slot in tqdm(range(start, end + 1), desc="eth2 blocks", unit="slot"):
-                row = fetch_block(slot)
-                if row is not None:
-                    rows.append(row)
-        # Write out rows and provenance
-        out = part_path(self.root, "raw", "blocks", self.chain_id, self.network, date)
-        write_rows(rows, out, self.format)
-        write_provenance(out, Provenance(
-            source=self.base,
-            api_version="v2",
-            collector="eth2.blocks",
-            chain_id=self.chain_id,
-            network=self.network,
-            dataset="blocks",
-            rows=len(rows),
-        ).to_dict())
 
-    def _validators(self, date: str) -> None:
-        """Collect a snapshot of all validators at the current head state."""
+    def _validator_rows(self, items: List[Dict[str, Any]], now: int) -> List[Dict[str, Any]]:
+        """Build validator rows from a list of raw validator records."""
         rows: List[Dict[str, Any]] = []
-        try:
-            data = self._get("/eth/v1/beacon/states/head/validators")
-        except Exception as e:
-            logger.exception("eth2._validators fetch failed: %s", e)
-            # Even if the fetch fails we still write an empty file to mark the attempt
-            data = {}
-        now = int(datetime.now(timezone.utc).timestamp())
-        for v in data.get("data", []) or []:
+        for v in items:
             try:
                 info = v.get("validator", {}) or {}
-                rows.append(
-                    Validator(
-                        chain_id=self.chain_id,
-                        network=self.network,
-                        snapshot_ts=now,
-                        validator_id=str(v.get("index")),
-                        status=str(v.get("status")),
-                        balance=float(info.get("balance", 0)) / 1e9 if info.get("balance") is not None else None,
-                        effective_balance=float(info.get("effective_balance", 0)) / 1e9 if info.get("effective_balance") is not None else None,
-                        pubkey=info.get("pubkey"),
-                    ).model_dump()
-                )
+                rows.append({
+                    "chain_id": self.chain_id,
+                    "network": self.network,
+                    "snapshot_ts": now,
+                    "validator_id": str(v.get("index")),
+                    "status": str(v.get("status")),
+                    "balance": float(info.get("balance", 0)) / 1e9 if info.get("balance") is not None else None,
+                    "effective_balance": float(info.get("effective_balance", 0)) / 1e9 if info.get("effective_balance") is not None else None,
+                    "pubkey": info.get("pubkey"),
+                })
             except Exception as e:
                 logger.exception("eth2._validators row parse failed: %s", e)
                 continue
+        return rows
+
+    def _fetch_validator_chunk(self, start: int, size: int) -> Optional[List[Dict[str, Any]]]:
+        """Fetch one ``id``-range chunk of the head validator set.
+
+        Returns ``None`` on failure — distinct from the empty list that
+        marks the end of the set — so a dropped chunk aborts the dataset
+        instead of silently truncating it.
+        """
+        ids = ",".join(map(str, range(start, start + size)))
+        try:
+            data = self._get("/eth/v1/beacon/states/head/validators", params={"id": ids})
+        except Exception as e:
+            logger.exception("eth2._validators chunk at %s failed: %s", start, e)
+            return None
+        return data.get("data", []) or []
+
+    def _validators_chunked(self, writer: BatchWriter, now: int) -> None:
+        """Stream the validator set in concurrent fixed-size id chunks.
+
+        The head validator set on mainnet is a single JSON document in the
+        hundreds of MB; chunking by validator index turns it into many
+        small responses fetched in parallel, each streamed to the writer as
+        it parses. A chunk shorter than requested marks the end of the set.
+        """
+        chunk = self.validator_chunk
+        next_start = 0
+        while True:
+            starts = list(range(next_start, next_start + chunk * self.max_workers, chunk))
+            next_start = starts[-1] + chunk
+            futures = [
+                self._executor.submit(self._fetch_validator_chunk, st, chunk)
+                for st in starts
+            ]
+            # Consume in index order so output stays sorted and the
+            # first short chunk cleanly terminates the scan. A failed
+            # chunk (None) aborts the dataset rather than writing a
+            # truncated snapshot that looks complete.
+            for i, fut in enumerate(futures):
+                items = fut.result()
+                if items is None:
+                    for later in futures[i + 1:]:
+                        later.cancel()
+                    raise RuntimeError(
+                        f"eth2 validator chunk at index {starts[i]} failed; "
+                        "aborting validators snapshot"
+                    )
+                writer.write_rows(self._validator_rows(items, now))
+                if len(items) < chunk:
+                    return
+
+    def _validators_streamed(self, writer: BatchWriter, now: int) -> None:
+        """Stream the single-request validator snapshot through ijson.
+
+        Parses validator records incrementally off the response body, so
+        neither the decoded document nor the full row list is ever held in
+        memory — peak usage is one flush batch.
+        """
+        try:
+            resp = self._session.get(
+                self.base + "/eth/v1/beacon/states/head/validators",
+                stream=True,
+                timeout=(3.05, 30),
+            )
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            batch: List[Dict[str, Any]] = []
+            for v in ijson.items(resp.raw, "data.item"):
+                batch.append(v)
+                if len(batch) >= _FLUSH_ROWS:
+                    writer.write_rows(self._validator_rows(batch, now))
+                    batch = []
+            writer.write_rows(self._validator_rows(batch, now))
+        except Exception as e:
+            logger.exception("eth2._validators streaming fetch failed: %s", e)
+
+    def _validators(self, date: str) -> None:
+        """Collect a snapshot of all validators at the current head state."""
+        now = int(datetime.now(timezone.utc).timestamp())
         out = part_path(self.root, "raw", "validators", self.chain_id, self.network, date)
-        write_rows(rows, out, self.format)
+        with BatchWriter(out, ARROW_SCHEMAS["validators"], self.format) as writer:
+            if self.max_workers > 1:
+                self._validators_chunked(writer, now)
+            elif ijson is not None:
+                self._validators_streamed(writer, now)
+            else:
+                try:
+                    data = self._get("/eth/v1/beacon/states/head/validators")
+                except Exception as e:
+                    logger.exception("eth2._validators fetch failed: %s", e)
+                    # Even if the fetch fails we still write an empty file to mark the attempt
+                    data = {}
+                writer.write_rows(self._validator_rows(data.get("data", []) or [], now))
         write_provenance(out, Provenance(
             source=self.base,
             api_version="v1",
@@ -201,124 +797,163 @@ class Eth2Collector:
             chain_id=self.chain_id,
             network=self.network,
             dataset="validators",
-            rows=len(rows),
+            rows=writer.rows_written,
         ).to_dict())
 
-    def _attestations(self, start: int, end: int, date: str) -> None:
-        """Collect attestations from blocks in a slot range."""
+    def _block_row(self, b: Dict[str, Any]) -> Dict[str, Any]:
+        """Build one block row from a parsed ``data.message`` payload.
 
-        def fetch_att(slot: int) -> Optional[List[Dict[str, Any]]]:
-            """Fetch attestations for a single slot. Returns a list of row dicts."""
-            try:
-                b = self._get(f"/eth/v2/beacon/blocks/{slot}")["data"]["message"]
-                rows_for_slot: List[Dict[str, Any]] = []
-                for att in b["body"].get("attestations", []) or []:
-                    ad = att.get("data", {}) or {}
-                    rows_for_slot.append(
-                        Attestation(
-                            chain_id=self.chain_id,
-                            network=self.network,
-                            height_or_slot=int(b["slot"]),
-                            epoch=int(b["slot"]) // 32,
-                            committee_index=int(ad.get("index")) if ad.get("index") is not None else None,
-                            head_block_root=ad.get("beacon_block_root"),
-                            source_epoch=int(ad.get("source", {}).get("epoch")) if ad.get("source") else None,
-                            target_epoch=int(ad.get("target", {}).get("epoch")) if ad.get("target") else None,
-                        ).model_dump()
-                    )
-                return rows_for_slot
-            except Exception as e:
-                logger.exception("eth2._attestations failed for slot %s: %s", slot, e)
-                return None
+        Rows are plain dict literals mirroring the Block model: the payload
+        came from our own _get and the Arrow schema types each column at
+        write time, so per-row pydantic validation buys nothing here.
+        """
+        slot_i = int(b["slot"])
+        return {
+            "chain_id": self.chain_id,
+            "network": self.network,
+            "height_or_slot": slot_i,
+            "epoch": slot_i // 32,
+            "block_hash": None,
+            "parent_hash": None,
+            "proposer_index": int(b.get("proposer_index", -1)),
+            "proposer_address": None,
+            "timestamp_utc": None,
+        }
 
-        all_rows: List[Dict[str, Any]] = []
-        total = end - start + 1
-        if self.max_workers > 1:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {executor.submit(fetch_att, slot): slot for slot in range(start, end + 1)}
-                with tqdm(total=total, desc="eth2 attestations", unit="slot") as pbar:
-                    for fut in as_completed(futures):
-                        res = fut.result()
-                        if res:
-                            all_rows.extend(res)
-                        pbar.update(1)
-        else:
-            for slot in tqdm(range(start, end + 1), desc="eth2 attestations", unit="slot"):
-                res = fetch_att(slot)
-                if res:
-                    all_rows.extend(res)
-        out = part_path(self.root, "raw", "attestations", self.chain_id, self.network, date)
-        write_rows(all_rows, out, self.format)
-        write_provenance(out, Provenance(
-            source=self.base,
-            api_version="v2",
-            collector="eth2.attestations",
-            chain_id=self.chain_id,
-            network=self.network,
-            dataset="attestations",
-            rows=len(all_rows),
-        ).to_dict())
+    def _penalty_rows(self, b: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build slashing (penalty) rows from a parsed ``data.message`` payload."""
+        rows: List[Dict[str, Any]] = []
+        body = b["body"]
+        slot_i = int(b["slot"])
+        chain_id = self.chain_id
+        network = self.network
+        for penalty_type, key in (
+            ("proposer_slashing", "proposer_slashings"),
+            ("attester_slashing", "attester_slashings"),
+        ):
+            for s in body.get(key) or []:
+                rows.append({
+                    "chain_id": chain_id,
+                    "network": network,
+                    "height_or_slot": slot_i,
+                    "validator_id": None,
+                    "penalty_type": penalty_type,
+                    "value": None,
+                    "meta_json": _dumps(s),
+                })
+        return rows
+
+    def _block_datasets(self, start: int, end: int, date: str, wanted: List[str]) -> None:
+        """Collect every requested block-derived dataset from one fetch pass.
+
+        Blocks, attestations and penalties all parse the same
+        ``/eth/v2/beacon/blocks/{slot}`` response, so each slot is fetched
+        and JSON-decoded exactly once and routed through the row builders
+        for the datasets in ``wanted``. When only attestations are wanted,
+        the dedicated attestations sub-endpoint is used instead — its
+        response skips the execution payload and the rest of the block
+        body, an order of magnitude fewer bytes per slot.
+        """
+        atts_only = wanted == ["attestations"]
+        outs = {
+            d: part_path(self.root, "raw", d, self.chain_id, self.network, date)
+            for d in wanted
+        }
+        rows: Dict[str, List[Dict[str, Any]]] = {
+            d: [] for d in wanted if d != "attestations"
+        }
+        att_buf = _AttestationBuffer() if "attestations" in wanted else None
+        with ExitStack() as stack:
+            writers = {
+                d: stack.enter_context(BatchWriter(outs[d], ARROW_SCHEMAS[d], self.format))
+                for d in wanted
+            }
+            # One background thread owns all parquet writes, fed through a
+            # bounded queue, so encoding/compression overlaps waiting on
+            # the beacon node instead of running strictly after it.
+            write_q: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=8)
+            write_err: List[BaseException] = []
 
-    def _penalties(self, start: int, end: int, date: str) -> None:
-        """Collect slashing events (penalties) from blocks in a slot range."""
+            def drain() -> None:
+                # Keep consuming even after a write fails: dying here would
+                # leave the producer blocked forever on the bounded put().
+                # Later batches are discarded and the first error is
+                # re-raised on the producer side after join().
+                while True:
+                    item = write_q.get()
+                    if item is None:
+                        return
+                    if write_err:
+                        continue
+                    dataset, batch = item
+                    try:
+                        if isinstance(batch, pa.RecordBatch):
+                            writers[dataset].write_batch(batch)
+                        else:
+                            writers[dataset].write_rows(batch)
+                    except BaseException as e:
+                        logger.exception("eth2 write thread failed: %s", e)
+                        write_err.append(e)
 
-        def fetch_penalties(slot: int) -> Optional[List[Dict[str, Any]]]:
+            writer_thread = threading.Thread(target=drain, name="eth2-writer")
+            writer_thread.start()
             try:
-                b = self._get(f"/eth/v2/beacon/blocks/{slot}")["data"]["message"]
-                body = b["body"]
-                rows_for_slot: List[Dict[str, Any]] = []
-                for s in body.get("proposer_slashings", []) or []:
-                    rows_for_slot.append(
-                        Penalty(
-                            chain_id=self.chain_id,
-                            network=self.network,
-                            height_or_slot=int(b["slot"]),
-                            validator_id=None,
-                            penalty_type="proposer_slashing",
-                            value=None,
-                            meta_json=_json.dumps(s),
-                        ).model_dump()
+                if atts_only:
+                    payloads = self._iter_slot_payloads(
+                        start,
+                        end,
+                        "eth2 attestations",
+                        path_fmt=_ATTESTATIONS_PATH_FMT,
+                        extract=_extract_data,
                     )
-                for s in body.get("attester_slashings", []) or []:
-                    rows_for_slot.append(
-                        Penalty(
-                            chain_id=self.chain_id,
-                            network=self.network,
-                            height_or_slot=int(b["slot"]),
-                            validator_id=None,
-                            penalty_type="attester_slashing",
-                            value=None,
-                            meta_json=_json.dumps(s),
-                        ).model_dump()
+                else:
+                    payloads = self._iter_slot_payloads(
+                        start, end, "eth2 " + "+".join(wanted)
                     )
-                return rows_for_slot
-            except Exception as e:
-                logger.exception("eth2._penalties failed for slot %s: %s", slot, e)
-                return None
-        all_rows: List[Dict[str, Any]] = []
-        total = end - start + 1
-        if self.max_workers > 1:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {executor.submit(fetch_penalties, slot): slot for slot in range(start, end + 1)}
-                with tqdm(total=total, desc="eth2 penalties", unit="slot") as pbar:
-                    for fut in as_completed(futures):
-                        res = fut.result()
-                        if res:
-                            all_rows.extend(res)
-                        pbar.update(1)
-        else:
-            for slot in tqdm(range(start, end + 1), desc="eth2 penalties", unit="slot"):
-                res = fetch_penalties(slot)
-                if res:
-                    all_rows.extend(res)
-        out = part_path(self.root, "raw", "penalties", self.chain_id, self.network, date)
-        write_rows(all_rows, out, self.format)
-        write_provenance(out, Provenance(
-            source=self.base,
-            api_version="v2",
-            collector="eth2.penalties",
-            chain_id=self.chain_id,
-            network=self.network,
-            dataset="penalties",
-            rows=len(all_rows),
-        ).to_dict())
+                for slot, b in payloads:
+                    if write_err:
+                        # No point fetching the rest of the window once
+                        # writes are failing; the error surfaces below.
+                        break
+                    if b is None:
+                        continue
+                    try:
+                        if atts_only:
+                            att_buf.append(b or [], slot)
+                        else:
+                            if "blocks" in rows:
+                                rows["blocks"].append(self._block_row(b))
+                            if att_buf is not None:
+                                att_buf.append(
+                                    b["body"].get("attestations") or [], int(b["slot"])
+                                )
+                            if "penalties" in rows:
+                                rows["penalties"].extend(self._penalty_rows(b))
+                    except Exception as e:
+                        logger.exception("eth2 block parse failed for slot %s: %s", slot, e)
+                    if att_buf is not None and len(att_buf) >= _FLUSH_ROWS:
+                        write_q.put(("attestations", att_buf.to_batch(self.chain_id, self.network)))
+                        att_buf = _AttestationBuffer()
+                    for d, buf in rows.items():
+                        if len(buf) >= _FLUSH_ROWS:
+                            write_q.put((d, buf))
+                            rows[d] = []
+                if att_buf is not None:
+                    write_q.put(("attestations", att_buf.to_batch(self.chain_id, self.network)))
+                for d, buf in rows.items():
+                    write_q.put((d, buf))
+            finally:
+                write_q.put(None)
+                writer_thread.join()
+                if write_err:
+                    raise write_err[0]
+        for dataset in wanted:
+            write_provenance(outs[dataset], Provenance(
+                source=self.base,
+                api_version="v2",
+                collector=f"eth2.{dataset}",
+                chain_id=self.chain_id,
+                network=self.network,
+                dataset=dataset,
+                rows=writers[dataset].rows_written,
+            ).to_dict())
@@ -5,9 +5,13 @@ This module defines :class:`PolkadotCollector`, which uses the
 (e.g. Polkadot or Kusama). It retrieves block headers, the current
 validator set, and slashing events in a specified height range.
 
-At present this collector operates sequentially. Concurrency is not
-implemented because the underlying WebSocket interface provided by
-`py‑substrate‑interface` does not lend itself to safe concurrent use.
+Block hashes are resolved in JSON-RPC batches over the node's WebSocket
+connection, which removes one round trip per block. Per-block body and
+event queries run on a bounded thread pool with the raw RPC exchange
+serialized through a lock: the websocket sees one request at a time, but
+SCALE decoding of one block overlaps the round trip of the next. If the
+substrate library still objects to concurrent use, the collector falls
+back to a sequential loop.
 """
 
 from __future__ import annotations
@@ -16,22 +20,52 @@ from typing import List, Optional
 from pathlib import Path
 from tqdm import tqdm
 import json as _json
-from datetime import datetime, timezone
+from typing import Any
+import time
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
+
+try:
+    # orjson is optional. Slash events carry nested attribute payloads and
+    # its Rust serializer builds the meta_json strings several times faster
+    # than stdlib json on penalty-heavy blocks.
+    import orjson as _orjson  # type: ignore
+except Exception:
+    _orjson = None  # type: ignore
+
+if _orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return _orjson.dumps(obj).decode()
+else:
+    def _dumps(obj: Any) -> str:
+        return _json.dumps(obj)
 
 try:
     # The substrateinterface package is optional and may not be installed in all
     # environments. Import it lazily to allow the module to be imported without
     # immediately raising if the dependency is missing. See __init__ for details.
     from substrateinterface import SubstrateInterface  # type: ignore
+    from substrateinterface.storage import StorageKey  # type: ignore
+    from scalecodec.base import ScaleBytes  # type: ignore
 except Exception:
     SubstrateInterface = None  # type: ignore
-from common.storage import write_rows, part_path, write_provenance
+    StorageKey = None  # type: ignore
+    ScaleBytes = None  # type: ignore
+from common.storage import write_rows, part_path, write_provenance, BatchWriter
 from common.provenance import Provenance
-from common.schemas import Block, Validator, Penalty
+from common.schemas import ARROW_SCHEMAS
 
 logger = logging.getLogger(__name__)
 
+# Heights per JSON-RPC batch request; bounds both the batch payload size and
+# how many hashes are held before their blocks are fetched.
+_RPC_BATCH = 64
+
+# Staking event variants that count as penalties ("Slash" pre-runtime-9090,
+# "Slashed" after).
+_SLASH_EVENT_IDS = frozenset(("Slash", "Slashed"))
+
 # Uses py-substrate-interface to query a Substrate/Polkadot node (recommended in official docs).
 # We retrieve:
 #  - blocks: headers via get_block for a range
@@ -46,14 +80,20 @@ class PolkadotCollector:
         * ``network``: Network name (default ``"mainnet"``).
         * ``rpc``: WebSocket RPC endpoint URL.
         * ``root``: Root directory for output data.
-        * ``format``: Output format (``"parquet"`` or ``"csv"``).
+        * ``format``: Output format (``"feather"`` default, ``"parquet"``
+          or ``"csv"``).
+        * ``max_workers``: Threads decoding blocks/events concurrently
+          (default 8; ``1`` forces the sequential loop).
     """
 
     def __init__(self, cfg: dict) -> None:
         self.chain_id: str = "polkadot"
         self.network: str = cfg.get("network", "mainnet")
         self.rpc: str = cfg.get("rpc", "wss://rpc.polkadot.io")
-        self.format: str = cfg.get("format", "parquet")
+        # Raw partitions default to Feather v2 + LZ4: markedly faster to
+        # land than Parquet+zstd at similar size for these small parts.
+        # The curated layer stays Parquet regardless.
+        self.format: str = cfg.get("format", "feather")
         self.root: Path = Path(cfg.get("root", "data"))
         # Defer importing SubstrateInterface until instantiation time. If the
         # optional dependency is missing, raise an informative error.
@@ -65,6 +105,136 @@ class PolkadotCollector:
         # Initialise a substrate interface. When connecting to a private node
         # you may need to specify additional parameters (e.g. type registry).
         self.substrate = SubstrateInterface(url=self.rpc)
+        # Serializes raw writes on the shared websocket (see _batch_rpc).
+        self._rpc_lock = threading.Lock()
+        # Cleared on the first batch failure so every later window goes
+        # straight to the sequential path instead of failing again.
+        self._batch_rpc_ok = True
+        # System.Events storage key, resolved once on first use (see
+        # _events_at); cleared like _batch_rpc_ok when the fast path fails.
+        self._events_key = None
+        self._events_key_ok = StorageKey is not None
+        # Staking pallet index, resolved with the events key; -1 disables
+        # the raw-bytes prefilter in _events_at.
+        self._staking_idx: Optional[int] = None
+        # Validator set keyed by (network, session index); the set only
+        # changes across sessions (~6h), so repeated collections within one
+        # session skip the Session.Validators query. Holds one session.
+        self._validator_set_cache: dict = {}
+        self.max_workers: int = int(cfg.get("max_workers", 8))
+        self._parallel_ok = self.max_workers > 1
+        if self._parallel_ok:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="polkadot"
+            )
+            # The websocket protocol handling in substrate-interface is not
+            # thread-safe; route every raw RPC exchange through one lock so
+            # workers interleave only the SCALE decoding that follows it.
+            if hasattr(self.substrate, "rpc_request"):
+                unlocked = self.substrate.rpc_request
+
+                def _locked_rpc(method, params, result_handler=None):
+                    with self._rpc_lock:
+                        return unlocked(method, params, result_handler)
+
+                self.substrate.rpc_request = _locked_rpc
+
+    def _batch_rpc(self, method: str, params_list: List[list]) -> List:
+        """Issue one JSON-RPC batch array over the node websocket.
+
+        Substrate nodes answer a JSON array of requests with an array of
+        responses in arbitrary order; results are reordered by request id
+        and returned positionally aligned with ``params_list``.
+        """
+        ws = getattr(self.substrate, "websocket", None)
+        if ws is None:
+            raise RuntimeError("substrate interface exposes no websocket")
+        payload = _json.dumps(
+            [
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": p}
+                for i, p in enumerate(params_list)
+            ]
+        )
+        with self._rpc_lock:
+            ws.send(payload)
+            replies = _json.loads(ws.recv())
+        results: List = [None] * len(params_list)
+        for r in replies:
+            results[int(r["id"])] = r.get("result")
+        return results
+
+    def _block_hashes(self, heights: range) -> List[Optional[str]]:
+        """Resolve block hashes for a window of heights.
+
+        Uses one batched ``chain_getBlockHash`` round trip when the node
+        accepts batch arrays, otherwise falls back to sequential lookups
+        for the rest of the run.
+        """
+        if self._batch_rpc_ok:
+            try:
+                return self._batch_rpc("chain_getBlockHash", [[h] for h in heights])
+            except Exception as e:
+                logger.warning(
+                    "polkadot batch RPC unavailable (%s); using sequential lookups", e
+                )
+                self._batch_rpc_ok = False
+        return [self.substrate.get_block_hash(h) for h in heights]
+
+    def _events_at(self, block_hash: str, staking_only: bool = False) -> list:
+        """Return the decoded ``System.Events`` records for a block.
+
+        ``get_events`` re-resolves runtime metadata and the storage key on
+        every call; this resolves the key once and issues a bare
+        ``state_getStorageAt``, decoding with the cached key's value type.
+        With ``staking_only`` the raw bytes are prescanned for the staking
+        pallet's index byte and the (dominant) SCALE decode is skipped when
+        it cannot occur. The cached metadata assumes no runtime upgrade
+        inside the window — a decode failure flips the collector back to
+        ``get_events`` for the rest of the run.
+        """
+        if not self._events_key_ok:
+            return self.substrate.get_events(block_hash=block_hash)
+        try:
+            if self._events_key is None:
+                self.substrate.init_runtime()
+                self._events_key = StorageKey.create_from_storage_function(
+                    "System",
+                    "Events",
+                    [],
+                    runtime_config=self.substrate.runtime_config,
+                    metadata=self.substrate.metadata,
+                )
+                try:
+                    self._staking_idx = int(
+                        self.substrate.metadata.get_metadata_pallet("Staking").value["index"]
+                    )
+                except Exception:
+                    self._staking_idx = -1
+            raw = self.substrate.rpc_request(
+                "state_getStorageAt", [self._events_key.to_hex(), block_hash]
+            )["result"]
+            if (
+                staking_only
+                and raw is not None
+                and self._staking_idx is not None
+                and self._staking_idx >= 0
+                and bytes((self._staking_idx,)) not in bytes.fromhex(raw[2:])
+            ):
+                # The staking pallet's index byte appears nowhere in the raw
+                # SCALE bytes, so no staking event can be present; skip the
+                # decode entirely. A stray matching byte in unrelated event
+                # data only costs a full decode — never a missed event.
+                return []
+            obj = self._events_key.decode_scale_value(
+                ScaleBytes(raw) if raw is not None else None
+            )
+            return obj.elements if obj else []
+        except Exception as e:
+            logger.warning(
+                "polkadot cached events key unusable (%s); using get_events", e
+            )
+            self._events_key_ok = False
+            return self.substrate.get_events(block_hash=block_hash)
 
     def _head_number(self) -> int:
         """Return the current best block number reported by the node."""
@@ -108,43 +278,121 @@ class PolkadotCollector:
             self._penalties(start, end, ingest_date)
         # (No "attestations" concept for Substrate/Polkadot; skip)
 
-    def _blocks(self, start: int, end: int, date: str) -> None:
-        """Collect block headers in a sequential manner for a height range."""
+    def _scan_window(self, window: range, hashes: List[Optional[str]], fn):
+        """Apply a per-block row builder over one hash window.
+
+        Runs on the shared thread pool when parallel mode is on, consuming
+        results in height order. Failures never raise out of the loop:
+        each height is retried once after a short pause, then counted and
+        reported back to the caller for one summary log line per run —
+        no per-iteration stack-trace formatting inside the hot loop. If
+        every height in a threaded window fails — the symptom of the
+        substrate library rejecting concurrent use — the collector
+        reverts to sequential mode and retries the window once.
+
+        :returns: ``(rows, failures)`` for the window.
+        """
+        pairs = [(h, bh) for h, bh in zip(window, hashes) if bh is not None]
         rows: List[dict] = []
-        for h in tqdm(range(start, end + 1), desc="polkadot blocks", unit="block"):
+
+        def consume(results) -> int:
+            failures = 0
+            for (h, _), res in zip(pairs, results):
+                if isinstance(res, Exception):
+                    failures += 1
+                    logger.debug("polkadot fetch failed for height %s: %s", h, res)
+                else:
+                    rows.extend(res)
+            return failures
+
+        def guarded(pair):
             try:
-                block_hash = self.substrate.get_block_hash(h)
-                if block_hash is None:
-                    continue
-                block = self.substrate.get_block(block_hash=block_hash)
-                header = block["header"]
-                ts: Optional[int] = None
-                for ex in block.get("extrinsics", []) or []:
+                return fn(*pair)
+            except Exception:
+                time.sleep(0.5)
+            try:
+                return fn(*pair)
+            except Exception as e:  # noqa: BLE001 - surfaced to consume()
+                return e
+
+        if self._parallel_ok and pairs:
+            failures = consume(list(self._executor.map(guarded, pairs)))
+            if failures < len(pairs):
+                return rows, failures
+            logger.warning(
+                "polkadot: all %d heights in window failed under threading; "
+                "reverting to sequential mode",
+                len(pairs),
+            )
+            self._parallel_ok = False
+            rows.clear()
+        return rows, consume([guarded(pair) for pair in pairs])
+
+    def _block_row(self, h: int, block_hash: str) -> List[dict]:
+        """Build the block_core row for one height."""
+        block = self.substrate.get_block(block_hash=block_hash)
+        header = block["header"]
+        ts: Optional[int] = None
+        exs = block.get("extrinsics") or []
+        # Substrate convention places the inherent Timestamp::set extrinsic
+        # at index 0, so checking the first entry resolves the timestamp in
+        # O(1) on virtually every block; the linear scan remains as a
+        # fallback for non-standard block layouts.
+        if exs:
+            first = exs[0]
+            call = first.get("call") or {}
+            if (
+                call.get("call_module") == "Timestamp"
+                and call.get("call_function") == "set"
+            ):
+                # first arg is moment (milliseconds)
+                ts = int(first["params"][0]["value"]) // 1000
+            else:
+                for ex in exs:
                     if (
                         ex["call"]["call_module"] == "Timestamp"
                         and ex["call"]["call_function"] == "set"
                     ):
-                        # first arg is moment (milliseconds)
                         ts = int(ex["params"][0]["value"]) // 1000
                         break
-                rows.append(
-                    Block(
-                        chain_id=self.chain_id,
-                        network=self.network,
-                        height_or_slot=int(h),
-                        epoch=None,
-                        block_hash=str(block_hash),
-                        parent_hash=str(header["parentHash"]),
-                        proposer_index=None,
-                        proposer_address=None,
-                        timestamp_utc=ts,
-                    ).model_dump()
-                )
-            except Exception as e:
-                logger.exception("polkadot._blocks failed for height %s: %s", h, e)
-                continue
+        # Plain dict in model-field order; per-row pydantic validation is
+        # interpreter overhead the Arrow schema re-checks at write time.
+        return [
+            {
+                "chain_id": self.chain_id,
+                "network": self.network,
+                "height_or_slot": int(h),
+                "epoch": None,
+                "block_hash": str(block_hash),
+                "parent_hash": str(header["parentHash"]),
+                "proposer_index": None,
+                "proposer_address": None,
+                "timestamp_utc": ts,
+            }
+        ]
+
+    def _blocks(self, start: int, end: int, date: str) -> None:
+        """Collect block headers for a height range."""
         out = part_path(self.root, "raw", "blocks", self.chain_id, self.network, date)
-        write_rows(rows, out, self.format)
+        pbar = tqdm(total=end - start + 1, desc="polkadot blocks", unit="block")
+        # Each hash window flushes straight to the part file, so peak
+        # memory is one window of rows rather than the whole height range.
+        failures = 0
+        with BatchWriter(out, ARROW_SCHEMAS["blocks"], self.format) as writer:
+            for w0 in range(start, end + 1, _RPC_BATCH):
+                window = range(w0, min(w0 + _RPC_BATCH, end + 1))
+                rows, failed = self._scan_window(
+                    window, self._block_hashes(window), self._block_row
+                )
+                writer.write_rows(rows)
+                failures += failed
+                pbar.update(len(window))
+            pbar.close()
+            rows_written = writer.rows_written
+        if failures:
+            logger.warning(
+                "polkadot._blocks: %d of %d heights failed", failures, end - start + 1
+            )
         write_provenance(out, Provenance(
             source=self.rpc,
             api_version="rpc",
@@ -152,32 +400,52 @@ class PolkadotCollector:
             chain_id=self.chain_id,
             network=self.network,
             dataset="blocks",
-            rows=len(rows),
+            rows=rows_written,
         ).to_dict())
 
     def _validators(self, date: str) -> None:
-        """Collect the current validator set snapshot."""
+        """Collect the current validator set snapshot.
+
+        The snapshot is cached per session index: if the session hasn't
+        rolled over since the last collection, only the cheap
+        ``Session.CurrentIndex`` query hits the node.
+        """
         rows: List[dict] = []
-        now = int(datetime.now(timezone.utc).timestamp())
+        now = int(time.time())
+        session_index = None
         try:
-            vals = self.substrate.query(module="Session", storage_function="Validators").value
-            for vid in vals or []:
+            session_index = self.substrate.query(
+                module="Session", storage_function="CurrentIndex"
+            ).value
+            cache_key = (self.network, session_index)
+            vals = self._validator_set_cache.get(cache_key)
+            if vals is None:
+                vals = (
+                    self.substrate.query(
+                        module="Session", storage_function="Validators"
+                    ).value
+                    or []
+                )
+                self._validator_set_cache.clear()
+                self._validator_set_cache[cache_key] = vals
+            chain_id, network = self.chain_id, self.network
+            for vid in vals:
                 rows.append(
-                    Validator(
-                        chain_id=self.chain_id,
-                        network=self.network,
-                        snapshot_ts=now,
-                        validator_id=str(vid),
-                        status="ACTIVE",
-                        balance=None,
-                        effective_balance=None,
-                        pubkey=None,
-                    ).model_dump()
+                    {
+                        "chain_id": chain_id,
+                        "network": network,
+                        "snapshot_ts": now,
+                        "validator_id": str(vid),
+                        "status": "ACTIVE",
+                        "balance": None,
+                        "effective_balance": None,
+                        "pubkey": None,
+                    }
                 )
         except Exception as e:
             logger.exception("polkadot._validators fetch failed: %s", e)
         out = part_path(self.root, "raw", "validators", self.chain_id, self.network, date)
-        write_rows(rows, out, self.format)
+        write_rows(rows, out, self.format, schema=ARROW_SCHEMAS["validators"])
         write_provenance(out, Provenance(
             source=self.rpc,
             api_version="rpc",
@@ -186,39 +454,49 @@ class PolkadotCollector:
             network=self.network,
             dataset="validators",
             rows=len(rows),
+            note=f"session_index={session_index}" if session_index is not None else None,
         ).to_dict())
 
+    def _penalty_rows(self, h: int, block_hash: str) -> List[dict]:
+        """Build penalty rows for the slashing events of one height."""
+        rows: List[dict] = []
+        for ev in self._events_at(block_hash, staking_only=True):
+            v = ev.value
+            if v["module_id"] == "Staking" and v["event_id"] in _SLASH_EVENT_IDS:
+                # The event attributes vary; capture the raw event JSON
+                rows.append(
+                    {
+                        "chain_id": self.chain_id,
+                        "network": self.network,
+                        "height_or_slot": int(h),
+                        "validator_id": None,
+                        "penalty_type": "staking_slash",
+                        "value": None,
+                        "meta_json": _dumps(v),
+                    }
+                )
+        return rows
+
     def _penalties(self, start: int, end: int, date: str) -> None:
         """Collect staking slashing events in a height range."""
-        rows: List[dict] = []
-        for h in tqdm(range(start, end + 1), desc="polkadot penalties", unit="block"):
-            try:
-                block_hash = self.substrate.get_block_hash(h)
-                if block_hash is None:
-                    continue
-                events = self.substrate.get_events(block_hash=block_hash)
-                for ev in events:
-                    if (
-                        ev.value["module_id"] == "Staking"
-                        and ev.value["event_id"] in ("Slash", "Slashed")
-                    ):
-                        # The event attributes vary; capture the raw event JSON
-                        rows.append(
-                            Penalty(
-                                chain_id=self.chain_id,
-                                network=self.network,
-                                height_or_slot=int(h),
-                                validator_id=None,
-                                penalty_type="staking_slash",
-                                value=None,
-                                meta_json=_json.dumps(ev.value),
-                            ).model_dump()
-                        )
-            except Exception as e:
-                logger.exception("polkadot._penalties failed for height %s: %s", h, e)
-                continue
         out = part_path(self.root, "raw", "penalties", self.chain_id, self.network, date)
-        write_rows(rows, out, self.format)
+        pbar = tqdm(total=end - start + 1, desc="polkadot penalties", unit="block")
+        failures = 0
+        with BatchWriter(out, ARROW_SCHEMAS["penalties"], self.format) as writer:
+            for w0 in range(start, end + 1, _RPC_BATCH):
+                window = range(w0, min(w0 + _RPC_BATCH, end + 1))
+                rows, failed = self._scan_window(
+                    window, self._block_hashes(window), self._penalty_rows
+                )
+                writer.write_rows(rows)
+                failures += failed
+                pbar.update(len(window))
+            pbar.close()
+            rows_written = writer.rows_written
+        if failures:
+            logger.warning(
+                "polkadot._penalties: %d of %d heights failed", failures, end - start + 1
+            )
         write_provenance(out, Provenance(
             source=self.rpc,
             api_version="rpc",
@@ -226,5 +504,5 @@ class PolkadotCollector:
             chain_id=self.chain_id,
             network=self.network,
             dataset="penalties",
-            rows=len(rows),
+            rows=rows_written,
         ).to_dict())
@@ -11,9 +11,12 @@ Key features:
   connection pooling, which can significantly reduce latency when making
   many requests to the same host.
 * A default User‑Agent is set to identify the client when making requests.
-* The `tenacity` library is used to implement an exponential backoff
-  strategy, retrying failed requests up to a configurable maximum number
-  of attempts.
+* Transient errors are retried at the transport layer by a
+  :class:`urllib3.util.retry.Retry` policy with exponential backoff,
+  honouring ``Retry-After`` headers, instead of a hand-rolled sleep loop.
+* Response bodies are decoded with ``orjson`` when it is installed.
+* :func:`get_json_many` fans independent GETs to the same host out over
+  a multiplexed HTTP/2 connection when ``httpx`` is installed.
 
 This function is intended to be thread‑safe and is safe to use from
 multiple threads. If additional configuration is required (for example,
@@ -21,21 +24,81 @@ proxies or custom adapters), you may modify the ``session`` instance
 below accordingly.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+import asyncio
+import json as _json
+import logging
 import requests
-import time
-import random
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-__all__ = ["get_json"]
+try:
+    # orjson is optional; its Rust parser decodes large JSON payloads
+    # several times faster than the stdlib decoder behind response.json().
+    import orjson as _orjson  # type: ignore
+except Exception:
+    _orjson = None  # type: ignore
+
+try:
+    # isal is optional. Its igzip implementation inflates gzip bodies 2-4x
+    # faster than stdlib zlib, which matters on multi-MB JSON payloads
+    # (validator sets, attestation dumps) where decompression rivals
+    # parsing in the wall-time profile.
+    from isal import isal_zlib as _isal_zlib  # type: ignore
+except Exception:
+    _isal_zlib = None  # type: ignore
+
+try:
+    # httpx is optional. Its async client multiplexes many GETs over one
+    # HTTP/2 connection, so get_json_many amortises the TCP/TLS handshake
+    # across a whole batch instead of paying one per request.
+    import httpx  # type: ignore
+except Exception:
+    httpx = None  # type: ignore
+
+try:
+    # h2 is a separate install from httpx (the http2 extra); without it
+    # httpx.AsyncClient(http2=True) raises at construction, so the flag is
+    # gated on its presence and the client falls back to HTTP/1.1.
+    import h2  # type: ignore  # noqa: F401
+except Exception:
+    h2 = None  # type: ignore
+
+__all__ = ["get_json", "get_json_many"]
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_USER_AGENT = "hybrid-dataset/0.1"
+_MAX_ATTEMPTS = 5
 
 # Shared HTTP session for connection pooling. See
 # https://docs.python-requests.org/en/latest/user/advanced/#session-objects
+# The mounted adapter retries transient errors with exponential backoff at
+# the transport layer, replacing the old per-call retry loop.
 _session = requests.Session()
-_DEFAULT_USER_AGENT = "hybrid-dataset/0.1"
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=_MAX_ATTEMPTS,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+    ),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
 
-_MAX_ATTEMPTS = 5
-_INITIAL_DELAY = 0.5  # seconds
-_MAX_DELAY = 8.0  # seconds
+# Prebuilt defaults so calls without extra headers skip the dict merge.
+# The isal fast path inflates gzip only, so when it is active we must not
+# advertise deflate — a deflate-encoded body would reach the JSON parser
+# still compressed. Without isal, urllib3 decodes both.
+_BASE_HEADERS: Dict[str, str] = {
+    "User-Agent": _DEFAULT_USER_AGENT,
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip" if _isal_zlib is not None else "gzip, deflate",
+}
 
 def get_json(
     url: str,
@@ -45,10 +108,10 @@ def get_json(
 ) -> Any:
     """Perform a GET request against ``url`` and return the JSON response.
 
-    This function wraps a shared :class:`requests.Session` instance and
-    automatically retries on transient errors using an exponential backoff
-    strategy with jitter. A default User‑Agent header is always sent and
-    can be overridden or supplemented via the ``headers`` parameter.
+    This function wraps a shared :class:`requests.Session` instance whose
+    adapter automatically retries on transient errors using an exponential
+    backoff strategy. A default User‑Agent header is always sent and can
+    be overridden or supplemented via the ``headers`` parameter.
 
     :param url: The absolute URL to request.
     :param params: Optional dictionary of query parameters to include.
@@ -58,27 +121,100 @@ def get_json(
     :raises: Any exception raised by :mod:`requests` on failure after
         exhausting retries.
     """
-    req_headers: Dict[str, str] = {"User-Agent": _DEFAULT_USER_AGENT}
     if headers:
-        req_headers.update(headers)
-    attempt = 0
-    delay = _INITIAL_DELAY
-    while True:
-        try:
-            response = _session.get(
-                url,
-                params=params or {},
-                headers=req_headers,
-                timeout=timeout,
+        req_headers = {**_BASE_HEADERS, **headers}
+    else:
+        req_headers = _BASE_HEADERS
+    if _isal_zlib is not None:
+        # Take the body undecoded and inflate gzip with ISA-L instead of
+        # letting urllib3 run it through stdlib zlib.
+        response = _session.get(
+            url,
+            params=params,
+            headers=req_headers,
+            timeout=timeout,
+            stream=True,
+        )
+        response.raise_for_status()
+        raw = response.raw.read(decode_content=False)
+        if response.headers.get("Content-Encoding") == "gzip":
+            content = _isal_zlib.decompress(raw, 31)
+        else:
+            content = raw if raw else response.content
+    else:
+        response = _session.get(
+            url,
+            params=params,
+            headers=req_headers,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        content = response.content
+    if _orjson is not None:
+        return _orjson.loads(content)
+    return _json.loads(content)
+
+def get_json_many(
+    urls: List[str],
+    params_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 20,
+    concurrency: int = 32,
+) -> List[Optional[Any]]:
+    """Fetch many URLs and return their JSON payloads in input order.
+
+    When ``httpx`` is installed the requests are multiplexed over an
+    HTTP/2 connection with at most ``concurrency`` in flight; otherwise
+    they fall back to sequential :func:`get_json` calls through the
+    pooled session. A failed URL yields ``None`` in its slot rather than
+    aborting the batch; failures are logged.
+
+    :param urls: Absolute URLs to request.
+    :param params_list: Optional per-URL query parameter dicts, aligned
+        with ``urls``.
+    :param headers: Optional headers applied to every request.
+    :param timeout: Per-request timeout in seconds.
+    :param concurrency: Maximum number of requests in flight.
+    :returns: One parsed payload (or ``None``) per input URL.
+    """
+    if params_list is None:
+        params_list = [None] * len(urls)
+    if httpx is None:
+        out: List[Optional[Any]] = []
+        for url, params in zip(urls, params_list):
+            try:
+                out.append(get_json(url, params=params, headers=headers, timeout=timeout))
+            except Exception as e:
+                logger.warning("get_json_many fetch failed for %s: %s", url, e)
+                out.append(None)
+        return out
+
+    async def _run() -> List[Optional[Any]]:
+        req_headers = {**_BASE_HEADERS, **headers} if headers else _BASE_HEADERS
+        sem = asyncio.Semaphore(concurrency)
+        results: List[Optional[Any]] = [None] * len(urls)
+
+        async def fetch_one(i: int, url: str, params: Optional[Dict[str, Any]]) -> None:
+            async with sem:
+                try:
+                    r = await client.get(url, params=params)
+                    r.raise_for_status()
+                    if _orjson is not None:
+                        results[i] = _orjson.loads(r.content)
+                    else:
+                        results[i] = _json.loads(r.content)
+                except Exception as e:
+                    logger.warning("get_json_many fetch failed for %s: %s", url, e)
+
+        async with httpx.AsyncClient(
+            http2=h2 is not None,
+            headers=req_headers,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=timeout,
+        ) as client:
+            await asyncio.gather(
+                *[fetch_one(i, u, p) for i, (u, p) in enumerate(zip(urls, params_list))]
             )
-            response.raise_for_status()
-            return response.json()
-        except Exception:
-            attempt += 1
-            if attempt >= _MAX_ATTEMPTS:
-                # Re-raise the last exception to the caller
-                raise
-            # Exponential backoff with jitter
-            sleep_time = delay + random.uniform(0, delay)
-            time.sleep(sleep_time)
-            delay = min(delay * 2, _MAX_DELAY)
+        return results
+
+    return asyncio.run(_run())
@@ -11,13 +11,41 @@ automatically.
 """
 
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import json
+import os
+import threading
+
+try:
+    # orjson is optional; provenance files are written once per dataset per
+    # run, so this mainly avoids stdlib json's slower pretty-printer.
+    import orjson as _orjson  # type: ignore
+except Exception:
+    _orjson = None  # type: ignore
 from typing import List, Dict, Any, Optional
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from common.schemas import rows_to_batch
 
+# Directories already created by this process; guards the mkdir syscall in
+# part_path, which matters on network filesystems where mkdir is a round trip.
+_ensured_dirs: set = set()
+_ensured_lock = threading.Lock()
+
+@lru_cache(maxsize=2048)
 def part_path(root: Path, layer: str, table: str, chain_id: str, network: str, date: str) -> Path:
     """Construct and return a partitioned directory path, creating it if absent.
 
+    Calls are memoized: every collector method, curator table and read
+    rebuilds the same handful of paths, so repeat calls skip both the Path
+    construction and the ``mkdir`` syscall. The directory is assumed to
+    survive for the life of the process once created.
+
     :param root: Base directory where all data is stored. May be a :class:`pathlib.Path`
       or a string.
     :param layer: Data layer (e.g. ``"raw"``, ``"curated"``, ``"features"``).
@@ -29,7 +57,11 @@ def part_path(root: Path, layer: str, table: str, chain_id: str, network: str, d
     """
     base = Path(root)
     p = base / layer / table / f"chain_id={chain_id}" / f"network={network}" / f"date={date}"
-    p.mkdir(parents=True, exist_ok=True)
+    if p not in _ensured_dirs:
+        with _ensured_lock:
+            if p not in _ensured_dirs:
+                p.mkdir(parents=True, exist_ok=True)
+                _ensured_dirs.add(p)
     return p
 
 def write_rows(
@@ -37,37 +69,242 @@ def write_rows(
     outdir: Path,
     fmt: str = "parquet",
     filename: str = "part-000",
+    schema: Optional[pa.Schema] = None,
 ) -> None:
     """Persist a list of row dictionaries to disk in the specified format.
 
     If ``rows`` is empty the function will create a sentinel ``.empty``
     file to indicate that the dataset is empty but has been processed.
-    When data is present, it is written as either CSV or Parquet without
-    including an index column.
+    Parquet output converts row dicts straight to an Arrow table —
+    skipping the pandas hop and its object-dtype promotion — and writes
+    with zstd compression. A DataFrame is also accepted for callers that
+    already hold one (curators, feature builders).
 
-    :param rows: List of dictionaries representing rows.
+    :param rows: List of dictionaries representing rows, or a DataFrame.
     :param outdir: Output directory. Must already exist; created by
         :func:`part_path` in normal use.
-    :param fmt: Output format: ``"parquet"`` (default) or ``"csv"``.
+    :param fmt: Output format: ``"parquet"`` (default), ``"csv"`` or ``"feather"``.
     :param filename: Base filename without extension. A suffix will be
         appended based on the format.
+    :param schema: Optional Arrow schema (see
+        :data:`common.schemas.ARROW_SCHEMAS`); gives stable types for
+        nullable int columns instead of inference from the rows at hand.
     :raises ValueError: If ``fmt`` is not supported.
     :raises IOError: If the file cannot be written.
     """
-    df = pd.DataFrame(rows)
-    if df.empty:
+    if len(rows) == 0:
         # Create an explicit marker file to indicate that the dataset was
         # intentionally empty. This can be used downstream to detect the
         # absence of data versus a missing run.
         (outdir / f"{filename}.empty").write_text("", encoding="utf-8")
         return
+    if isinstance(rows, pd.DataFrame):
+        table = pa.Table.from_pandas(rows, schema=schema, preserve_index=False)
+    elif schema is not None:
+        table = pa.Table.from_batches([rows_to_batch(rows, schema)])
+    else:
+        table = pa.Table.from_pylist(rows)
+    if fmt == "csv":
+        table.to_pandas().to_csv(outdir / f"{filename}.csv", index=False)
+    elif fmt == "parquet":
+        pq.write_table(
+            table,
+            outdir / f"{filename}.parquet",
+            compression="zstd",
+            data_page_size=1 << 20,
+        )
+    elif fmt == "feather":
+        # Feather v2 (Arrow IPC) with LZ4 frames: several times faster to
+        # encode than Parquet+zstd at comparable size for small raw
+        # partitions.
+        feather.write_feather(
+            table, outdir / f"{filename}.feather", compression="lz4"
+        )
+    else:
+        raise ValueError(f"Unsupported output format: {fmt}")
+
+def write_batch(
+    batch: pa.RecordBatch,
+    outdir: Path,
+    fmt: str = "parquet",
+    filename: str = "part-000",
+) -> None:
+    """Persist an Arrow record batch to disk in the specified format.
+
+    Columnar counterpart to :func:`write_rows` for collectors that
+    accumulate struct-of-arrays buffers instead of per-row dicts. An empty
+    batch produces the same ``.empty`` sentinel file as an empty row list.
+
+    :param batch: Record batch to write; its schema drives the output types.
+    :param outdir: Output directory, created by :func:`part_path` in normal use.
+    :param fmt: Output format: ``"parquet"`` (default), ``"csv"`` or ``"feather"``.
+    :param filename: Base filename without extension.
+    :raises ValueError: If ``fmt`` is not supported.
+    """
+    if batch.num_rows == 0:
+        (outdir / f"{filename}.empty").write_text("", encoding="utf-8")
+        return
+    table = pa.Table.from_batches([batch])
     if fmt == "csv":
-        df.to_csv(outdir / f"{filename}.csv", index=False)
+        table.to_pandas().to_csv(outdir / f"{filename}.csv", index=False)
     elif fmt == "parquet":
-        df.to_parquet(outdir / f"{filename}.parquet", index=False)
+        pq.write_table(
+            table,
+            outdir / f"{filename}.parquet",
+            compression="zstd",
+            data_page_size=1 << 20,
+        )
+    elif fmt == "feather":
+        feather.write_feather(
+            table, outdir / f"{filename}.feather", compression="lz4"
+        )
     else:
         raise ValueError(f"Unsupported output format: {fmt}")
 
+def write_table(
+    table: pa.Table,
+    outdir: Path,
+    fmt: str = "parquet",
+    filename: str = "part-000",
+) -> None:
+    """Persist an Arrow table to disk in the specified format.
+
+    Table-level counterpart to :func:`write_batch`, for callers (the
+    curator) that already hold a full table. An empty table produces the
+    same ``.empty`` sentinel file.
+
+    :param table: Table to write; its schema drives the output types.
+    :param outdir: Output directory, created by :func:`part_path` in normal use.
+    :param fmt: Output format: ``"parquet"`` (default), ``"csv"`` or ``"feather"``.
+    :param filename: Base filename without extension.
+    :raises ValueError: If ``fmt`` is not supported.
+    """
+    if table.num_rows == 0:
+        (outdir / f"{filename}.empty").write_text("", encoding="utf-8")
+        return
+    if fmt == "csv":
+        table.to_pandas().to_csv(outdir / f"{filename}.csv", index=False)
+    elif fmt == "parquet":
+        pq.write_table(
+            table,
+            outdir / f"{filename}.parquet",
+            compression="zstd",
+            data_page_size=1 << 20,
+        )
+    elif fmt == "feather":
+        feather.write_feather(
+            table, outdir / f"{filename}.feather", compression="lz4"
+        )
+    else:
+        raise ValueError(f"Unsupported output format: {fmt}")
+
+class BatchWriter:
+    """Incrementally persist row batches to a single part file.
+
+    Streaming counterpart to :func:`write_rows`/:func:`write_batch` for
+    collectors that flush fixed-size batches while still fetching: peak
+    memory stays bounded by the batch size instead of the full dataset.
+    Parquet output goes through one :class:`pyarrow.parquet.ParquetWriter`
+    held open across flushes; CSV output is appended with the header
+    written only once. If nothing is ever written, :meth:`close` leaves the
+    same ``.empty`` sentinel file as the one-shot writers. Leaving the
+    ``with`` block on an exception discards the in-progress part file
+    instead of finalizing it: a truncated part would otherwise be a valid
+    file that downstream readers glob up and ingest as complete.
+
+    :param outdir: Output directory, created by :func:`part_path` in normal use.
+    :param schema: Arrow schema for the dataset (see
+        :data:`common.schemas.ARROW_SCHEMAS`).
+    :param fmt: Output format: ``"parquet"`` (default), ``"csv"`` or ``"feather"``.
+    :param filename: Base filename without extension.
+    :raises ValueError: If ``fmt`` is not supported.
+    """
+
+    def __init__(
+        self,
+        outdir: Path,
+        schema: pa.Schema,
+        fmt: str = "parquet",
+        filename: str = "part-000",
+    ) -> None:
+        if fmt not in ("parquet", "csv", "feather"):
+            raise ValueError(f"Unsupported output format: {fmt}")
+        self.schema = schema
+        self.fmt = fmt
+        self.rows_written = 0
+        self._outdir = outdir
+        self._filename = filename
+        self._writer = None
+
+    def write_batch(self, batch: pa.RecordBatch) -> None:
+        """Flush one record batch to the part file."""
+        if batch.num_rows == 0:
+            return
+        if self.fmt == "parquet":
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(
+                    self._outdir / f"{self._filename}.parquet",
+                    self.schema,
+                    compression="zstd",
+                )
+            self._writer.write_batch(batch)
+        elif self.fmt == "feather":
+            # Feather v2 is the Arrow IPC file format, so batches stream
+            # through an IPC writer with LZ4-compressed frames.
+            if self._writer is None:
+                self._writer = pa.ipc.new_file(
+                    str(self._outdir / f"{self._filename}.feather"),
+                    self.schema,
+                    options=pa.ipc.IpcWriteOptions(compression="lz4"),
+                )
+            self._writer.write_batch(batch)
+        else:
+            # The first flush truncates so a re-run over the same partition
+            # replaces the previous part file (as the one-shot writers do)
+            # instead of appending behind its header.
+            path = self._outdir / f"{self._filename}.csv"
+            first = self.rows_written == 0
+            batch.to_pandas().to_csv(
+                path, index=False, mode="w" if first else "a", header=first
+            )
+        self.rows_written += batch.num_rows
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Flush a batch of row dicts, converting via the writer's schema."""
+        if rows:
+            self.write_batch(rows_to_batch(rows, self.schema))
+
+    def close(self) -> None:
+        """Finalize the part file, or leave an ``.empty`` marker if no rows came."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif self.rows_written == 0:
+            (self._outdir / f"{self._filename}.empty").write_text("", encoding="utf-8")
+
+    def discard(self) -> None:
+        """Abort: close the underlying writer and remove the partial part file."""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+            self._writer = None
+        path = self._outdir / f"{self._filename}.{self.fmt}"
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "BatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
 def write_provenance(outdir: Path, payload: Dict[str, Any], name: str = "_PROVENANCE.json") -> None:
     """Write a provenance JSON file describing a dataset generation event.
 
@@ -77,6 +314,11 @@ def write_provenance(outdir: Path, payload: Dict[str, Any], name: str = "_PROVEN
     :param name: Filename of the provenance file. Defaults to
         ``"_PROVENANCE.json"``.
     """
+    if _orjson is not None:
+        (outdir / name).write_bytes(
+            _orjson.dumps(payload, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+        )
+        return
     with open(outdir / name, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
 
@@ -87,6 +329,7 @@ def read_any(
     chain_id: str,
     network: str,
     date: str,
+    columns: Optional[List[str]] = None,
 ) -> pd.DataFrame:
     """Read any available dataset fragments (CSV or Parquet) into a single DataFrame.
 
@@ -100,24 +343,74 @@ def read_any(
     :param chain_id: Blockchain identifier.
     :param network: Network identifier.
     :param date: Date partition.
+    :param columns: Optional column projection. Only these columns are
+        read (or kept, on readers without projection pushdown); columns
+        absent from the data are silently dropped rather than raised, so
+        callers can project across heterogeneous partitions. Parquet
+        scans then only touch the requested column chunks, which cuts
+        bytes read roughly by the fraction of row width skipped.
     :returns: A :class:`pandas.DataFrame` containing the concatenated data.
     """
     # Determine partition directory; ensure it exists before scanning
     p = part_path(root, layer, table, chain_id, network, date)
-    files = list(p.glob("*.parquet")) + list(p.glob("*.csv"))
-    if not files:
+    parquets = sorted(p.glob("*.parquet"))
+    feathers = sorted(p.glob("*.feather"))
+    csvs = sorted(p.glob("*.csv"))
+    if not parquets and not feathers and not csvs:
         return pd.DataFrame()
+
+    def _project(df: pd.DataFrame) -> pd.DataFrame:
+        if columns is None:
+            return df
+        return df[[c for c in columns if c in df.columns]]
+
     dfs = []
-    for f in files:
+    if parquets:
+        # One multi-threaded dataset scan reads and concatenates all
+        # parquet parts in C++; fall back to per-file reads so a single
+        # corrupt part (e.g. a concurrent writer) doesn't lose the rest.
         try:
-            if f.suffix == ".parquet":
-                dfs.append(pd.read_parquet(f))
-            elif f.suffix == ".csv":
-                dfs.append(pd.read_csv(f))
+            dset = ds.dataset([str(f) for f in parquets], format="parquet")
+            present = (
+                [c for c in columns if c in dset.schema.names]
+                if columns is not None
+                else None
+            )
+            dfs.append(
+                dset.to_table(columns=present, use_threads=True)
+                .to_pandas(split_blocks=True, self_destruct=True)
+            )
         except Exception:
-            # Skip unreadable parts but continue scanning. This can occur if
-            # another process is concurrently writing to the same directory.
-            continue
+            for f in parquets:
+                try:
+                    dfs.append(_project(pd.read_parquet(f)))
+                except Exception:
+                    continue
+    if feathers:
+        for f in feathers:
+            try:
+                dfs.append(_project(feather.read_feather(f)))
+            except Exception:
+                continue
+    if csvs:
+        # CSV parsing is Python/pandas-bound per file; overlap the files
+        # on a thread pool, again skipping unreadable parts. usecols with a
+        # callable is lenient about columns a part doesn't have.
+        if columns is not None:
+            wanted = set(columns)
+            read_csv = lambda f: pd.read_csv(f, usecols=lambda c: c in wanted)  # noqa: E731
+        else:
+            read_csv = pd.read_csv
+        with ThreadPoolExecutor(
+            max_workers=min(len(csvs), os.cpu_count() or 4)
+        ) as ex:
+            for fut in [ex.submit(read_csv, f) for f in csvs]:
+                try:
+                    dfs.append(fut.result())
+                except Exception:
+                    continue
     if not dfs:
         return pd.DataFrame()
+    if len(dfs) == 1:
+        return dfs[0]
     return pd.concat(dfs, ignore_index=True)
@@ -1,7 +1,22 @@
 """Miscellaneous utility functions."""
 
+import time
 from datetime import datetime, timezone
 
+# (day number, formatted date); today_str formats at most once per UTC day.
+_today_cache: list = [None, None]
+
 def today_str() -> str:
-    """Return the current date in ``YYYY‑MM‑DD`` format (UTC)."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    """Return the current date in ``YYYY‑MM‑DD`` format (UTC).
+
+    The formatted string is cached per calendar day: callers on hot paths
+    pay one ``time.time()`` call and an integer compare instead of a
+    ``datetime`` construction and ``strftime`` each time.
+    """
+    day = int(time.time() // 86400)
+    if day != _today_cache[0]:
+        _today_cache[:] = [
+            day,
+            datetime.fromtimestamp(day * 86400, tz=timezone.utc).strftime("%Y-%m-%d"),
+        ]
+    return _today_cache[1]
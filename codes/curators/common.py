@@ -1,6 +1,53 @@
+"""Curation of raw partitions into the curated core tables.
+
+:class:`Curator` projects each raw dataset onto its curated column set and
+deduplicates rows. Both steps run on Arrow tables: the dataset scan reads
+only the requested columns (instead of materializing every raw column into
+pandas) and deduplication is a hash aggregation in C++ rather than a
+DataFrame ``drop_duplicates``.
+"""
+
 from pathlib import Path
-import pandas as pd
-from common.storage import ensure_dir, part_path, write_rows
+from typing import List, Optional
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+
+from common.storage import part_path, write_table
+from common.schemas import ARROW_SCHEMAS
+
+
+# (raw table, curated table, curated column projection). Each raw dataset
+# maps onto one curated core table through the same project/dedup/write
+# pipeline in :meth:`Curator.curate`.
+_CURATED_TABLES = (
+    (
+        "blocks",
+        "block_core",
+        ("chain_id", "network", "height_or_slot", "epoch", "block_hash",
+         "parent_hash", "proposer_index", "proposer_address", "timestamp_utc"),
+    ),
+    (
+        "validators",
+        "validator_core",
+        ("chain_id", "network", "snapshot_ts", "validator_id", "status",
+         "balance", "effective_balance", "slashed", "withdrawal_address"),
+    ),
+    (
+        "attestations",
+        "attestation_core",
+        ("chain_id", "network", "height_or_slot", "epoch", "committee_index",
+         "head_block_root", "source_epoch", "target_epoch"),
+    ),
+    (
+        "penalties",
+        "penalty_core",
+        ("chain_id", "network", "height_or_slot", "validator_id",
+         "penalty_type", "value", "meta_json"),
+    ),
+)
+
 
 class Curator:
     def __init__(self, cfg: dict):
@@ -9,49 +56,51 @@ class Curator:
         self.root = Path(cfg.get("root", "."))
         self.format = cfg.get("format", "parquet")
 
-    def _read_any(self, layer: str, table: str, date: str) -> pd.DataFrame:
+    def _read_table(self, layer: str, table: str, date: str, cols: List[str]) -> Optional[pa.Table]:
+        """Read a raw partition as an Arrow table scoped to ``cols``.
+
+        Parquet and Feather parts go through one multi-threaded dataset
+        scan that projects the requested columns at read time; CSV parts are read
+        with the Arrow CSV reader and concatenated. Columns absent from
+        the raw data are appended as typed nulls (typed from the matching
+        raw schema when it declares them). Returns ``None`` when the
+        partition holds no data.
+        """
         p = part_path(self.root, layer, table, self.chain_id, self.network, date)
-        files = list(p.glob("*.parquet")) + list(p.glob("*.csv"))
-        if not files: return pd.DataFrame()
-        if files[0].suffix == ".parquet":
-            return pd.read_parquet(files[0])
-        return pd.read_csv(files[0])
+        parquets = sorted(p.glob("*.parquet"))
+        feathers = sorted(p.glob("*.feather"))
+        csvs = sorted(p.glob("*.csv"))
+        if parquets or feathers:
+            fmt = "parquet" if parquets else "feather"
+            dset = ds.dataset([str(f) for f in (parquets or feathers)], format=fmt)
+            present = [c for c in cols if c in dset.schema.names]
+            t = dset.to_table(columns=present)
+        elif csvs:
+            t = pa.concat_tables(
+                [pacsv.read_csv(f) for f in csvs], promote_options="permissive"
+            )
+        else:
+            return None
+        if t.num_rows == 0:
+            return None
+        schema = ARROW_SCHEMAS.get(table)
+        for c in cols:
+            if c not in t.column_names:
+                typ = schema.field(c).type if schema is not None and c in schema.names else pa.string()
+                t = t.append_column(c, pa.nulls(len(t), type=typ))
+        return t.select(cols)
+
+    @staticmethod
+    def _dedup(t: pa.Table) -> pa.Table:
+        """Drop duplicate rows via a keys-only hash aggregation."""
+        return t.group_by(t.column_names, use_threads=False).aggregate([])
 
     def curate(self, ingest_date: str):
-        date = ingest_date
-
-        # blocks -> block_core
-        raw_blocks = self._read_any("raw", "blocks", date)
-        if not raw_blocks.empty:
-            out = part_path(self.root, "curated", "block_core", self.chain_id, self.network, date)
-            cols = ["chain_id","network","height_or_slot","epoch","block_hash","parent_hash","proposer_index","proposer_address","timestamp_utc"]
-            for c in cols:
-                if c not in raw_blocks.columns: raw_blocks[c] = None
-            write_rows(raw_blocks[cols].drop_duplicates(), out, self.format)
-
-        # validators -> validator_core
-        raw_vals = self._read_any("raw", "validators", date)
-        if not raw_vals.empty:
-            out = part_path(self.root, "curated", "validator_core", self.chain_id, self.network, date)
-            cols = ["chain_id","network","snapshot_ts","validator_id","status","balance","effective_balance","slashed","withdrawal_address"]
-            for c in cols:
-                if c not in raw_vals.columns: raw_vals[c] = None
-            write_rows(raw_vals[cols].drop_duplicates(), out, self.format)
-
-        # attestations -> attestation_core
-        raw_atts = self._read_any("raw", "attestations", date)
-        if not raw_atts.empty:
-            out = part_path(self.root, "curated", "attestation_core", self.chain_id, self.network, date)
-            cols = ["chain_id","network","height_or_slot","epoch","committee_index","head_block_root","source_epoch","target_epoch"]
-            for c in cols:
-                if c not in raw_atts.columns: raw_atts[c] = None
-            write_rows(raw_atts[cols].drop_duplicates(), out, self.format)
-
-        # penalties -> penalty_core
-        raw_pen = self._read_any("raw", "penalties", date)
-        if not raw_pen.empty:
-            out = part_path(self.root, "curated", "penalty_core", self.chain_id, self.network, date)
-            cols = ["chain_id","network","height_or_slot","validator_id","penalty_type","value","meta_json"]
-            for c in cols:
-                if c not in raw_pen.columns: raw_pen[c] = None
-            write_rows(raw_pen[cols].drop_duplicates(), out, self.format)
+        for raw_table, curated_table, cols in _CURATED_TABLES:
+            t = self._read_table("raw", raw_table, ingest_date, list(cols))
+            if t is None:
+                continue
+            out = part_path(
+                self.root, "curated", curated_table, self.chain_id, self.network, ingest_date
+            )
+            write_table(self._dedup(t), out, self.format)
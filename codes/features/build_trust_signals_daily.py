@@ -25,6 +25,9 @@ def build_trust_signals_daily(cfg: dict, date: str):
     df["z_prop"] = _z(df["proposed_blocks"].astype(float))
     df["trust_score_v1"] = df["z_att"] + 0.5*df["z_prop"]
 
-    out_rows = df[["chain_id","network","date","validator_id","trust_score_v1"]].to_dict(orient="records")
+    # Hand the projected frame straight to write_rows; materializing
+    # per-row dicts via to_dict("records") only to rebuild a table in the
+    # writer is pure Python overhead on large validator sets.
+    out = df[["chain_id","network","date","validator_id","trust_score_v1"]]
     out_dir = part_path(root, "features", "trust_signals_daily", chain, net, date)
-    write_rows(out_rows, out_dir, fmt)
+    write_rows(out, out_dir, fmt)
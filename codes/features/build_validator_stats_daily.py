@@ -1,7 +1,7 @@
 from pathlib import Path
 import pandas as pd
 import numpy as np
-from common.storage import part_path, write_rows
+from common.storage import part_path, read_any, write_rows
 
 def build_validator_stats_daily(cfg: dict, date: str):
     root = Path(cfg.get("root","."))
@@ -9,33 +9,26 @@ def build_validator_stats_daily(cfg: dict, date: str):
     net = cfg["network"]
     fmt = cfg.get("format","parquet")
 
-    # Inputs
-    vals_p = part_path(root, "curated", "validator_core", chain, net, date)
-    atts_p = part_path(root, "curated", "attestation_core", chain, net, date)
-    blocks_p = part_path(root, "curated", "block_core", chain, net, date)
-
-    def read_any(p: Path):
-        if p.exists():
-            fs = list(p.glob("*.parquet")) + list(p.glob("*.csv"))
-            if not fs: return pd.DataFrame()
-            dfs = [pd.read_parquet(f) if f.suffix==".parquet" else pd.read_csv(f) for f in fs]
-            return pd.concat(dfs, ignore_index=True)
-        return pd.DataFrame()
-
-    vals = read_any(vals_p)
-    atts = read_any(atts_p)
-    blocks = read_any(blocks_p)
-
-    # Minimal heuristic features (will refine later)
-    out_rows = []
+    # Inputs, projected down to the columns the features below actually
+    # touch so the parquet scans skip the rest of the row width.
+    vals = read_any(root, "curated", "validator_core", chain, net, date,
+                    columns=["validator_id"])
+    atts = read_any(root, "curated", "attestation_core", chain, net, date,
+                    columns=["height_or_slot"])
+    blocks = read_any(root, "curated", "block_core", chain, net, date,
+                      columns=["proposer_index"])
+
+    # Minimal heuristic features (will refine later). Built column-wise so
+    # per-validator work stays in vectorized pandas ops instead of an
+    # iterrows() loop over Python dicts.
+    out = pd.DataFrame()
     if not vals.empty:
         # Counts
-        proposed_blocks = 0
         if not blocks.empty and "proposer_index" in blocks.columns and blocks["proposer_index"].notna().any():
             # Only available for eth2
-            by_prop = blocks.groupby("proposer_index").size().to_dict()
+            by_prop = blocks.groupby("proposer_index").size()
         else:
-            by_prop = {}
+            by_prop = pd.Series(dtype="int64")
 
         # Attestation stats (eth2 only)
         if not atts.empty:
@@ -45,18 +38,22 @@ def build_validator_stats_daily(cfg: dict, date: str):
             total_atts = 0
             att_rate = np.nan
 
-        for _, v in vals.iterrows():
-            out_rows.append(dict(
-                chain_id=chain, network=net, date=date, validator_id=str(v["validator_id"]),
-                attestation_rate=att_rate,
-                avg_inclusion_delay=np.nan,   # needs committee expansion
-                missed_attestations=np.nan,   # requires per-validator trace
-                proposed_blocks=by_prop.get(int(v["validator_id"]) if str(v["validator_id"]).isdigit() else -1, 0),
-                slash_count_30d=np.nan,
-                stake_share=np.nan,
-                churn_events_30d=np.nan,
-                uptime_estimate=np.nan
-            ))
+        ids = vals["validator_id"].astype(str)
+        # Numeric ids map onto proposer counts; non-numeric (cosmos/polkadot
+        # addresses) coerce to NaN and fall through to 0.
+        keys = pd.to_numeric(ids, errors="coerce")
+        proposed = keys.map(by_prop).fillna(0).astype("int64")
+        out = pd.DataFrame(dict(
+            chain_id=chain, network=net, date=date, validator_id=ids,
+            attestation_rate=att_rate,
+            avg_inclusion_delay=np.nan,   # needs committee expansion
+            missed_attestations=np.nan,   # requires per-validator trace
+            proposed_blocks=proposed,
+            slash_count_30d=np.nan,
+            stake_share=np.nan,
+            churn_events_30d=np.nan,
+            uptime_estimate=np.nan
+        ))
 
     out_dir = part_path(root, "features", "validator_stats_daily", chain, net, date)
-    write_rows(out_rows, out_dir, fmt)
+    write_rows(out, out_dir, fmt)
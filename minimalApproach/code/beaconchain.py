@@ -1,35 +1,64 @@
 from __future__ import annotations
-from typing import Dict, Any
-from .http_client import HttpClient
+from typing import Dict, Any, List
+from http_client import HttpClient
 
-# Beaconcha.in /api/v1 endpoints relevant for validator collection
+# Beaconcha.in /api/v1 endpoints relevant for validator collection.
+# Both validator endpoints accept up to 100 comma-separated indexes per
+# request, so batch lookups cost one round-trip (and one rate-limit slot)
+# instead of one per validator.
+
+BATCH_SIZE = 100
+
+def _data_list(payload: Any) -> List[Dict[str, Any]]:
+    # "data" is a dict for a single index and a list for a batch.
+    d = payload.get("data", []) if isinstance(payload, dict) else []
+    return d if isinstance(d, list) else [d]
+
+def overview_path(indexes: List[int]) -> str:
+    return "validator/" + ",".join(map(str, indexes))
+
+def performance_path(indexes: List[int]) -> str:
+    return overview_path(indexes) + "/performance"
+
+def parse_overview(data: Any) -> Dict[int, Dict[str, Any]]:
+    out: Dict[int, Dict[str, Any]] = {}
+    for d in _data_list(data):
+        idx = d.get("validatorindex")
+        out[idx] = {
+            "validator_index": idx,
+            "pubkey": d.get("pubkey"),
+            "status": d.get("status"),
+            "effective_balance_gwei": d.get("effectivebalance"),
+            "slashed": d.get("slashed"),
+            "activation_epoch": d.get("activationepoch"),
+            "exit_epoch": d.get("exitepoch"),
+            "withdrawal_credentials": d.get("withdrawalcredentials"),
+        }
+    return out
+
+def parse_performance(data: Any) -> Dict[int, Dict[str, Any]]:
+    out: Dict[int, Dict[str, Any]] = {}
+    for p in _data_list(data):
+        idx = p.get("validatorindex")
+        out[idx] = {
+            "validator_index": idx,
+            "attestations_total": p.get("attestationscount"),
+            "att_missed_total": p.get("missedattestations"),
+            "proposals_total": p.get("proposalscount"),
+            "prop_missed_total": p.get("missedproposals"),
+            "inclusion_delay_avg": p.get("inclusiondelay"),
+            "rewards_sum_gwei": p.get("sumrewards"),
+        }
+    return out
+
+def get_validators_overview(client: HttpClient, indexes: List[int]) -> Dict[int, Dict[str, Any]]:
+    return parse_overview(client.get_json(overview_path(indexes)))
+
+def get_validators_performance(client: HttpClient, indexes: List[int]) -> Dict[int, Dict[str, Any]]:
+    return parse_performance(client.get_json(performance_path(indexes)))
 
 def get_validator_overview(client: HttpClient, index: int) -> Dict[str, Any]:
-    data = client.get_json(f"validator/{index}")
-    d = data.get("data", {}) if isinstance(data, dict) else {}
-    return {
-        "validator_index": index,
-        "pubkey": d.get("pubkey"),
-        "status": d.get("status"),
-        "effective_balance_gwei": d.get("effectivebalance"),
-        "slashed": d.get("slashed"),
-        "activation_epoch": d.get("activationepoch"),
-        "exit_epoch": d.get("exitepoch"),
-        "withdrawal_credentials": d.get("withdrawalcredentials"),
-    }
+    return get_validators_overview(client, [index]).get(index, {"validator_index": index})
 
 def get_validator_performance(client: HttpClient, index: int) -> Dict[str, Any]:
-    out = {"validator_index": index}
-    perf = client.get_json(f"validator/{index}/performance")
-    p = perf.get("data", {}) if isinstance(perf, dict) else {}
-    if isinstance(p, list):
-        p = p[0] if p else {}
-    out.update({
-        "attestations_total": p.get("attestationscount"),
-        "att_missed_total": p.get("missedattestations"),
-        "proposals_total": p.get("proposalscount"),
-        "prop_missed_total": p.get("missedproposals"),
-        "inclusion_delay_avg": p.get("inclusiondelay"),
-        "rewards_sum_gwei": p.get("sumrewards"),
-    })
-    return out
+    return get_validators_performance(client, [index]).get(index, {"validator_index": index})
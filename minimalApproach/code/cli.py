@@ -12,9 +12,13 @@ from config import (
 )
 from http_client import HttpClient
 from collectors.validators import load_validators_from_args
-from collectors.performance import collect_validator_rows
-from features.trust import compute_trust_v0
-from storage.io import write_outputs
+from collectors.performance import collect_validator_rows_to
+from features.trust import add_trust_v0
+from storage.io import ParquetStreamWriter, write_outputs
+
+# Rows are flushed to disk once this many have accumulated, bounding peak
+# memory at O(batch) rather than O(len(indexes)).
+BATCH_ROWS = 1000
 
 def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser(description="ETH-only dataset collector (Beaconcha.in /api/v1)")
@@ -66,12 +70,30 @@ def main() -> None:
         print("[ERROR] No validator indexes provided. Use --validators or --validators-file.", file=sys.stderr)
         sys.exit(2)
 
-    rows = collect_validator_rows(client, indexes)
-    for r in rows:
-        r["trust_v0"] = compute_trust_v0(r)
+    # Stream completed batches straight to disk: trust is computed per
+    # batch and the rows are released once written, so memory stays
+    # bounded however many validators the run covers.
+    stream = ParquetStreamWriter(out_dir / f"{args.out_prefix}.parquet")
+    batch: list = []
+
+    def flush() -> None:
+        add_trust_v0(batch)
+        write_outputs(batch, out_dir, args.out_prefix)
+        stream.write_rows(batch)
+        batch.clear()
 
-    write_outputs(rows, out_dir)
-    print(f"[OK] Wrote outputs to {out_dir}")
+    def on_rows(n: int, rows: list) -> None:
+        batch.extend(rows)
+        if len(batch) >= BATCH_ROWS:
+            flush()
+
+    total = collect_validator_rows_to(
+        client, indexes, on_rows, cache_path=out_dir / "validator_overview.parquet"
+    )
+    if batch:
+        flush()
+    stream.close()
+    print(f"[OK] Wrote {total} rows to {out_dir}")
 
 if __name__ == "__main__":
     main()
@@ -1,23 +1,181 @@
 from __future__ import annotations
-from typing import Dict, Any, List
-from beaconchain import get_validator_overview, get_validator_performance
-from http_client import HttpClient
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from beaconchain import (
+    BATCH_SIZE,
+    get_validators_overview,
+    get_validators_performance,
+    overview_path,
+    parse_overview,
+    parse_performance,
+    performance_path,
+)
+from http_client import AsyncHttpClient, HttpClient, aiohttp, httpx
+import asyncio
+import pandas as pd
 import requests.exceptions
 import sys
-import time
 
-def collect_validator_rows(client: HttpClient, indexes: List[int]) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    for idx in indexes:
-        try:
-            ov = get_validator_overview(client, idx)
-            time.sleep(client.rate_limit_seconds)
-            pf = get_validator_performance(client, idx)
-            rows.append({**ov, **pf})
-        except (requests.exceptions.RequestException, ValueError) as err:
-            print(f"[WARN] Failed to process index {idx}: {err}", file=sys.stderr)
-            continue
-        except Exception as err:
-            print(f"[ERROR] Unexpected error for index {idx}: {err}", file=sys.stderr)
+# Expected fetch/parse failures, warned per batch rather than aborting the
+# run. The client raises httpx errors when httpx is installed and requests
+# errors otherwise.
+_REQUEST_ERRORS = (requests.exceptions.RequestException, ValueError) + (
+    (httpx.HTTPError,) if httpx is not None else ()
+)
+
+# Every collected row carries exactly these keys in this order, so the
+# output frame can be assembled column-by-column without per-row key
+# inference.
+FIELDS = (
+    "validator_index", "pubkey", "status", "effective_balance_gwei",
+    "slashed", "activation_epoch", "exit_epoch", "withdrawal_credentials",
+    "attestations_total", "att_missed_total", "proposals_total",
+    "prop_missed_total", "inclusion_delay_avg", "rewards_sum_gwei",
+)
+
+# Overview data (pubkey, activation epoch, withdrawal credentials) only
+# changes on slashing/exit, so it is cached on disk across runs; only
+# performance counters are always re-fetched.
+OVERVIEW_FIELDS = FIELDS[:8]
+
+def _load_overview_cache(path: Path) -> Dict[int, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    try:
+        df = pd.read_parquet(path)
+    except Exception as err:
+        print(f"[WARN] Ignoring unreadable overview cache {path}: {err}", file=sys.stderr)
+        return {}
+    out: Dict[int, Dict[str, Any]] = {}
+    for r in df.to_dict("records"):
+        out[int(r["validator_index"])] = {k: r.get(k) for k in OVERVIEW_FIELDS}
+    return out
+
+def _save_overview_cache(path: Path, cache: Dict[int, Dict[str, Any]]) -> None:
+    rows = [cache[i] for i in sorted(cache)]
+    df = pd.DataFrame({k: [r.get(k) for r in rows] for k in OVERVIEW_FIELDS})
+    df.to_parquet(path, index=False)
+
+def _merge_chunk(
+    chunk: List[int],
+    cached_ov: Dict[int, Dict[str, Any]],
+    fetched: Dict[int, Dict[str, Any]],
+    pf: Dict[int, Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    rows = []
+    for idx in chunk:
+        ov = cached_ov.get(idx) or fetched.get(idx)
+        if ov is None and idx not in pf:
             continue
+        merged = {**(ov or {}), **pf.get(idx, {})}
+        rows.append({k: merged.get(k) for k in FIELDS})
     return rows
+
+def _fetch_chunk(
+    client: HttpClient, chunk: List[int], cached_ov: Dict[int, Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], Dict[int, Dict[str, Any]]]:
+    missing = [idx for idx in chunk if idx not in cached_ov]
+    fetched = parse_overview(client.get_json(overview_path(missing))) if missing else {}
+    pf = parse_performance(client.get_json(performance_path(chunk)))
+    return _merge_chunk(chunk, cached_ov, fetched, pf), fetched
+
+async def _collect_async(
+    client: HttpClient, chunks: List[List[int]], cache: Dict[int, Dict[str, Any]], emit
+) -> Dict[int, Dict[str, Any]]:
+    """Fan the chunk fetches out on one event loop instead of threads."""
+    fetched_ov: Dict[int, Dict[str, Any]] = {}
+    async with AsyncHttpClient(
+        client.base_url,
+        client.api_key,
+        client.api_key_transport,
+        client.rate_limit_seconds,
+        client.timeout_seconds,
+    ) as ac:
+
+        async def one(n: int, chunk: List[int]) -> None:
+            try:
+                missing = [idx for idx in chunk if idx not in cache]
+                fetched = parse_overview(await ac.get_json(overview_path(missing))) if missing else {}
+                pf = parse_performance(await ac.get_json(performance_path(chunk)))
+                emit(n, _merge_chunk(chunk, cache, fetched, pf))
+                fetched_ov.update(fetched)
+            except (aiohttp.ClientError, ValueError) as err:
+                print(f"[WARN] Failed to process batch {chunk[0]}..{chunk[-1]}: {err}", file=sys.stderr)
+            except Exception as err:
+                print(f"[ERROR] Unexpected error for batch {chunk[0]}..{chunk[-1]}: {err}", file=sys.stderr)
+
+        await asyncio.gather(*(one(n, chunk) for n, chunk in enumerate(chunks)))
+    return fetched_ov
+
+def collect_validator_rows_to(
+    client: HttpClient,
+    indexes: List[int],
+    on_rows,
+    max_workers: int = 8,
+    cache_path: Optional[Path] = None,
+) -> int:
+    """Fetch validator rows and stream them into ``on_rows`` per batch.
+
+    ``on_rows`` receives each completed chunk's row list as soon as its
+    fetch finishes (completion order, not input order), so callers can
+    persist and drop rows incrementally instead of holding the whole run
+    in memory. Returns the number of rows emitted.
+
+    Validators are fetched in batches of up to 100 per request (the
+    beaconcha.in comma-separated limit), fanned out on one event loop when
+    aiohttp is installed and over a thread pool otherwise. Either way a
+    shared _wait_for_slot limiter fires once per batch request, so
+    rate-limited wall time scales with the chunk count, not len(indexes).
+    """
+    cache = _load_overview_cache(cache_path) if cache_path else {}
+    chunks = [indexes[i:i + BATCH_SIZE] for i in range(0, len(indexes), BATCH_SIZE)]
+    total = 0
+
+    def emit(n: int, rows: List[Dict[str, Any]]) -> None:
+        nonlocal total
+        total += len(rows)
+        on_rows(n, rows)
+
+    if aiohttp is not None:
+        fetched_ov = asyncio.run(_collect_async(client, chunks, cache, emit))
+    else:
+        fetched_ov = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            # One submit() per chunk, never map(chunksize=...): every worker
+            # pulls its next chunk from the executor's shared queue the
+            # moment it finishes the last one, so a slow batch (429 retries)
+            # never strands work that a static pre-partition would have
+            # pinned to the same worker.
+            futures = {ex.submit(_fetch_chunk, client, chunk, cache): n for n, chunk in enumerate(chunks)}
+            for f in as_completed(futures):
+                n = futures[f]
+                try:
+                    rows, fetched = f.result()
+                    emit(n, rows)
+                    fetched_ov.update(fetched)
+                except _REQUEST_ERRORS as err:
+                    print(f"[WARN] Failed to process batch {chunks[n][0]}..{chunks[n][-1]}: {err}", file=sys.stderr)
+                except Exception as err:
+                    print(f"[ERROR] Unexpected error for batch {chunks[n][0]}..{chunks[n][-1]}: {err}", file=sys.stderr)
+    if cache_path and fetched_ov:
+        cache.update(fetched_ov)
+        try:
+            _save_overview_cache(cache_path, cache)
+        except Exception as err:
+            print(f"[WARN] Failed to write overview cache {cache_path}: {err}", file=sys.stderr)
+    return total
+
+def collect_validator_rows(
+    client: HttpClient,
+    indexes: List[int],
+    max_workers: int = 8,
+    cache_path: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch all validator rows into one list, ordered as ``indexes``."""
+    results: Dict[int, List[Dict[str, Any]]] = {}
+    collect_validator_rows_to(
+        client, indexes, lambda n, rows: results.__setitem__(n, rows),
+        max_workers=max_workers, cache_path=cache_path,
+    )
+    return [row for n in sorted(results) for row in results[n]]
@@ -1,32 +1,20 @@
 from __future__ import annotations
-from typing import List
+from pathlib import Path
+from typing import Iterator, List
 
-def load_validators_from_args(arg_str: str | None, file_path: str | None) -> List[int]:
-    vals: List[int] = []
+def _iter_tokens(arg_str: str | None, file_path: str | None) -> Iterator[str]:
     if arg_str:
         for tok in arg_str.split(","):
-            tok = tok.strip()
-            if not tok:
-                continue
-            try:
-                vals.append(int(tok))
-            except ValueError:
-                pass
+            yield tok.strip()
     if file_path:
-        from pathlib import Path
         p = Path(file_path)
         if p.exists():
             for line in p.read_text().splitlines():
-                s = line.strip()
-                if not s:
-                    continue
-                try:
-                    vals.append(int(s))
-                except ValueError:
-                    pass
-    # de-duplicate preserving order
-    seen, uniq = set(), []
-    for v in vals:
-        if v not in seen:
-            uniq.append(v); seen.add(v)
-    return uniq
+                yield line.strip()
+
+def load_validators_from_args(arg_str: str | None, file_path: str | None) -> List[int]:
+    # isdigit is a C-level check, far cheaper than raising and catching a
+    # ValueError per malformed token; dict.fromkeys de-duplicates
+    # order-preserving in a single pass.
+    vals = (int(t) for t in _iter_tokens(arg_str, file_path) if t.isdigit())
+    return list(dict.fromkeys(vals))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -57,7 +58,10 @@ def get_timeout_seconds() -> int:
     except Exception:
         return TIMEOUT_SECONDS_DEFAULT
 
+@lru_cache(maxsize=None)
 def get_out_dir(overridden: Optional[str] = None) -> Path:
+    # Memoized: the directory is created once per distinct argument, not
+    # stat()'d again on every call.
     p = Path(overridden) if overridden else DEFAULT_OUT_DIR
     p.mkdir(parents=True, exist_ok=True)
     return p
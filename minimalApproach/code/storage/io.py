@@ -2,15 +2,96 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List, Dict, Any
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# Fixed Arrow schema for collected validator rows (the FIELDS layout from
+# collectors.performance, plus the derived trust score), so streamed
+# batches all land with identical types.
+VALIDATOR_SCHEMA = pa.schema([
+    ("validator_index", pa.int64()),
+    ("pubkey", pa.string()),
+    ("status", pa.string()),
+    ("effective_balance_gwei", pa.int64()),
+    ("slashed", pa.bool_()),
+    ("activation_epoch", pa.int64()),
+    ("exit_epoch", pa.int64()),
+    ("withdrawal_credentials", pa.string()),
+    ("attestations_total", pa.int64()),
+    ("att_missed_total", pa.int64()),
+    ("proposals_total", pa.int64()),
+    ("prop_missed_total", pa.int64()),
+    ("inclusion_delay_avg", pa.float64()),
+    ("rewards_sum_gwei", pa.int64()),
+    ("trust_v0", pa.float64()),
+])
+
+try:
+    # Optional: polars packs a list of dicts straight into Arrow columns in
+    # one Rust pass (no pandas dtype inference) and writes CSV
+    # multi-threaded.
+    import polars as pl  # type: ignore
+except ImportError:
+    pl = None  # type: ignore
+
+# Directories already created this process; write_outputs runs once per
+# streamed batch, so skip the repeated mkdir/stat syscalls after the first.
+_dirs_seen: set = set()
 
 def write_outputs(rows: List[Dict[str, Any]], out_dir: Path, prefix: str = "validators_mvp") -> None:
-    df = pd.DataFrame(rows)
-    out_dir.mkdir(parents=True, exist_ok=True)
+    if out_dir not in _dirs_seen:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        _dirs_seen.add(out_dir)
     csv_path = out_dir / f"{prefix}.csv"
 
-    # Append to CSV if it exists
-    if csv_path.exists():
-        existing_df = pd.read_csv(csv_path)
-        df = pd.concat([existing_df, df], ignore_index=True)
+    # Append in place: writing only the new rows keeps each call O(new rows)
+    # instead of re-reading, concatenating and rewriting the whole file.
+    exists = csv_path.exists()
+    if pl is not None and rows:
+        with csv_path.open("ab") as f:
+            pl.from_dicts(rows).write_csv(f, include_header=not exists)
+        return
+
+    # Fallback: transpose to struct-of-arrays before handing off to pandas —
+    # building one list per column and constructing from a dict skips the
+    # per-row dict scan pandas does for a list of records. Collected rows
+    # share one key layout (collectors.performance.FIELDS), so the first
+    # row's keys cover them all. Serialization goes through Arrow's
+    # multi-threaded C++ CSV writer rather than DataFrame.to_csv's per-row
+    # Python formatter.
+    if rows:
+        df = pd.DataFrame({k: [r.get(k) for r in rows] for k in rows[0]})
+    else:
+        df = pd.DataFrame(rows)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with csv_path.open("ab") as f:
+        pacsv.write_csv(table, f, pacsv.WriteOptions(include_header=not exists))
+
+class ParquetStreamWriter:
+    """Stream row batches into one parquet file with bounded memory.
+
+    Each :meth:`write_rows` call appends a row group; only the current
+    batch is ever resident, so peak memory is O(batch size) no matter how
+    many validators a run covers. The file is created lazily on the first
+    non-empty batch and must be finalized with :meth:`close`.
+    """
+
+    def __init__(self, path: Path, schema: pa.Schema = VALIDATOR_SCHEMA):
+        self.path = path
+        self.schema = schema
+        self.rows_written = 0
+        self._writer = None
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, self.schema, compression="zstd")
+        self._writer.write_table(pa.Table.from_pylist(rows, schema=self.schema))
+        self.rows_written += len(rows)
 
-    df.to_csv(csv_path, index=False)
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -1,4 +1,12 @@
+import importlib.util
+import pathlib
+import sys
 import unittest
+
+# Resolve imports against this directory once at module load, so the suite
+# runs from any working directory (and discovery doesn't depend on cwd).
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+
 from config import get_api_base, get_api_key, get_api_key_transport, get_rate_limit_seconds, get_timeout_seconds, get_out_dir
 from http_client import HttpClient
 from beaconchain import get_validator_overview, get_validator_performance
@@ -7,6 +15,15 @@ from collectors.validators import load_validators_from_args
 from storage.io import write_outputs
 from pathlib import Path
 
+class TestImports(unittest.TestCase):
+    def test_modules_resolvable(self):
+        # find_spec only reads module metadata, so availability is checked
+        # without executing (or re-executing) any module top-level code.
+        for mod in ("config", "http_client", "beaconchain",
+                    "collectors.performance", "collectors.validators",
+                    "features.trust", "storage.io"):
+            self.assertIsNotNone(importlib.util.find_spec(mod), mod)
+
 class TestConfig(unittest.TestCase):
     def test_get_api_base(self):
         self.assertIsInstance(get_api_base(), str)